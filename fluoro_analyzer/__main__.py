@@ -11,6 +11,7 @@ Usage:
 
 import sys
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPixmapCache
 from .main_window import FluoroAnalyzer
 
 
@@ -19,6 +20,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("FluoroCount")
     app.setApplicationVersion("1.0.0")
+    QPixmapCache.setCacheLimit(256 * 1024)  # KB; room for a few full-size frames of large images
     
     window = FluoroAnalyzer()
     window.show()
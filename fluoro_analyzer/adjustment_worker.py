@@ -0,0 +1,71 @@
+"""
+Background adjustment worker for Fluorescence Microscope Image Analyzer.
+Applies image adjustments off the GUI thread so sliders stay responsive.
+"""
+
+from PyQt6.QtCore import QObject, QMutex, QMutexLocker, pyqtSignal
+
+from .image_processing import apply_all_adjustments, load_ndimage
+from .image_processing_numba import warm_up as warm_up_kernels
+
+
+class AdjustmentWorker(QObject):
+    """Applies image adjustments on a worker thread, latest request wins.
+
+    Requests are held in a single pending slot. If several arrive while an
+    image is being processed, only the most recent one is computed next.
+
+    A result is handed to the GUI thread, which calls result_displayed once
+    it has copied it into a pixmap. The next request is not started before
+    then, because region updates write into the same working buffer.
+    """
+
+    result_ready = pyqtSignal(object, object, object, object)  # image, adjustments, roi, adjusted image
+    _work_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._pending = None
+        self._awaiting_display = False
+        # Queued across threads once the worker is moved to its own thread
+        self._work_requested.connect(self._process)
+
+    def submit(self, image, adjustments, roi=None):
+        """Queue an image for adjustment, replacing any request not yet started.
+
+        roi is passed to apply_all_adjustments to update only that region.
+        """
+        with QMutexLocker(self._mutex):
+            self._pending = (image, adjustments.copy(), roi)
+            wake = not self._awaiting_display
+        if wake:
+            self._work_requested.emit()
+
+    def result_displayed(self):
+        """Hand the last result back (call from the GUI thread once it has been shown)."""
+        with QMutexLocker(self._mutex):
+            self._awaiting_display = False
+            wake = self._pending is not None
+        if wake:
+            self._work_requested.emit()
+
+    def warm_up(self):
+        """Compile optional JIT kernels and import scipy on the worker thread, off the GUI thread."""
+        warm_up_kernels()
+        load_ndimage()
+
+    def _process(self):
+        """Process the pending request, if one is still waiting."""
+        with QMutexLocker(self._mutex):
+            if self._awaiting_display:
+                return  # result_displayed wakes the worker again
+            job = self._pending
+            self._pending = None
+            if job is None:
+                return  # Already handled by an earlier wake-up
+            self._awaiting_display = True
+
+        image, adjustments, roi = job
+        adjusted = apply_all_adjustments(image, adjustments, roi)
+        self.result_ready.emit(image, adjustments, roi, adjusted)
@@ -4,8 +4,10 @@ Image canvas widget for Fluorescence Microscope Image Analyzer.
 
 from typing import Optional
 
-from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsTextItem
-from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPixmapItem, QGraphicsTextItem, QGraphicsLineItem
+)
+from PyQt6.QtCore import Qt, QPoint, QPointF, QRectF, pyqtSignal
 from PyQt6.QtGui import (
     QPixmap, QPainter, QColor, QPen, QBrush, QFont,
     QWheelEvent, QMouseEvent, QDragEnterEvent, QDropEvent
@@ -39,16 +41,20 @@ class ImageCanvas(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setBackgroundBrush(QBrush(QColor(30, 30, 30)))
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState)
         
         # State
         self.pixmap_item: Optional[QGraphicsPixmapItem] = None
+        self.interactive_preview = False
         self.tool_mode = ToolMode.PAN
         self.zoom_factor = 1.0
         self.placeholder_text: Optional[QGraphicsTextItem] = None
         
         # ROI drawing state
-        self.temp_line = None
+        self.temp_line: Optional[QGraphicsLineItem] = None
         self.last_roi_point: Optional[QPointF] = None
+        self._create_temp_line()
         
         # ROI editing state
         self.dragging_vertex = False
@@ -61,6 +67,9 @@ class ImageCanvas(QGraphicsView):
         self.dragging_marker = False
         self.selected_marker_index = -1
         
+        # Last pixel a drag was reported at, so sub-pixel moves are not emitted
+        self.last_drag_pixel: Optional[QPoint] = None
+        
         # Right-click panning state
         self.right_click_panning = False
         self.pan_start_pos: Optional[QPointF] = None
@@ -77,6 +86,7 @@ class ImageCanvas(QGraphicsView):
     def show_placeholder(self):
         """Show placeholder text when no image is loaded."""
         if self.placeholder_text is None:
+            # Built once; hide/show cycles only toggle visibility
             self.placeholder_text = QGraphicsTextItem("Drop image file here\n\nSupported formats:\nTIFF, PNG, JPEG")
             self.placeholder_text.setDefaultTextColor(QColor(100, 100, 100))
             font = QFont("Arial", 18)
@@ -84,13 +94,13 @@ class ImageCanvas(QGraphicsView):
             self.scene.addItem(self.placeholder_text)
             bounds = self.placeholder_text.boundingRect()
             self.placeholder_text.setPos(-bounds.width() / 2, -bounds.height() / 2)
-            self.setSceneRect(-200, -100, 400, 200)
+        self.placeholder_text.setVisible(True)
+        self.setSceneRect(-200, -100, 400, 200)
     
     def hide_placeholder(self):
         """Hide placeholder text."""
         if self.placeholder_text is not None:
-            self.scene.removeItem(self.placeholder_text)
-            self.placeholder_text = None
+            self.placeholder_text.setVisible(False)
     
     def set_tool_mode(self, mode: ToolMode):
         """Set the current tool mode."""
@@ -109,50 +119,91 @@ class ImageCanvas(QGraphicsView):
         """Set the last ROI point for real-time line drawing."""
         self.last_roi_point = point
     
+    def _create_temp_line(self):
+        """Create the hidden temporary ROI line, reused for every mouse move."""
+        pen = QPen(QColor(255, 255, 0, 180))
+        pen.setWidth(2)
+        pen.setStyle(Qt.PenStyle.DashLine)
+        self.temp_line = self.scene.addLine(0, 0, 0, 0, pen)
+        self.temp_line.setZValue(1)  # Above markers and ROI outlines
+        self.temp_line.setVisible(False)
+    
     def clear_temp_line(self):
         """Clear the temporary ROI line."""
-        if self.temp_line:
-            self.scene.removeItem(self.temp_line)
-            self.temp_line = None
+        if self.temp_line is not None:
+            self.temp_line.setVisible(False)
+    
+    def _drag_pixel_changed(self, scene_pos: QPointF) -> bool:
+        """Return True (and remember the pixel) if a drag reached a new whole-pixel position."""
+        pixel = scene_pos.toPoint()
+        if pixel == self.last_drag_pixel:
+            return False
+        self.last_drag_pixel = pixel
+        return True
     
     def set_image(self, pixmap: QPixmap):
         """Set the displayed image (resets view to fit)."""
-        self.hide_placeholder()
         self.scene.clear()
-        self.placeholder_text = None
+        self.placeholder_text = None  # Deleted by scene.clear(); rebuilt if shown again
         self.pixmap_item = QGraphicsPixmapItem(pixmap)
+        self._apply_pixmap_quality()
         self.scene.addItem(self.pixmap_item)
         self.setSceneRect(QRectF(pixmap.rect()))
         self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
         self.zoom_factor = 1.0
-        self.temp_line = None
+        self._create_temp_line()  # scene.clear() deleted the old one
         self.last_roi_point = None
     
-    def update_pixmap(self, pixmap: QPixmap):
-        """Update the displayed image without resetting view/zoom."""
+    def set_interactive_preview(self, enabled: bool):
+        """Trade rendering quality for speed while the image changes rapidly (e.g. slider drags)."""
+        if enabled == self.interactive_preview:
+            return
+        self.interactive_preview = enabled
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, not enabled)
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not enabled)
+        self._apply_pixmap_quality()
+    
+    def _apply_pixmap_quality(self):
+        """Set the image item's transformation and cache mode for the current preview state."""
         if self.pixmap_item is None:
-            self.set_image(pixmap)
             return
+        if self.interactive_preview:
+            # The pixmap is replaced on every update, so a cache would only be thrown away
+            self.pixmap_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+            self.pixmap_item.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        else:
+            self.pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+            # Keep the scaled image rasterised at the current zoom so scrolling blits it
+            # instead of resampling; setPixmap invalidates the cache on each update
+            self.pixmap_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+    
+    def update_pixmap(self, pixmap: QPixmap, scale: float = 1.0) -> bool:
+        """Update the displayed image without resetting view/zoom.
         
-        # Save current transform and scroll position
-        current_transform = self.transform()
-        h_scroll = self.horizontalScrollBar().value()
-        v_scroll = self.verticalScrollBar().value()
+        The existing pixmap item is updated in place, so markers, ROIs and
+        the view transform are left untouched.
         
-        # Clear and recreate scene
-        self.hide_placeholder()
-        self.scene.clear()
-        self.placeholder_text = None
-        self.pixmap_item = QGraphicsPixmapItem(pixmap)
-        self.scene.addItem(self.pixmap_item)
-        self.setSceneRect(QRectF(pixmap.rect()))
+        Args:
+            pixmap: Image to display
+            scale: Scene size of one pixmap pixel (e.g. 2.0 for a half-size preview)
         
-        # Restore transform and scroll position
-        self.setTransform(current_transform)
-        self.horizontalScrollBar().setValue(h_scroll)
-        self.verticalScrollBar().setValue(v_scroll)
+        Returns:
+            True if the scene had to be rebuilt (other items were removed)
+        """
+        if self.pixmap_item is None:
+            self.set_image(pixmap)
+            return True
         
-        self.temp_line = None
+        # A cache hit for the frame already shown is left alone, keeping the
+        # item's device cache and avoiding a repaint
+        if self.pixmap_item.pixmap().cacheKey() != pixmap.cacheKey():
+            self.pixmap_item.setPixmap(pixmap)
+        if self.pixmap_item.scale() != scale:
+            self.pixmap_item.setScale(scale)
+        scene_rect = self.pixmap_item.sceneBoundingRect()
+        if self.sceneRect() != scene_rect:
+            self.setSceneRect(scene_rect)
+        return False
     
     def wheelEvent(self, event: QWheelEvent):
         """Handle mouse wheel for zooming."""
@@ -181,6 +232,7 @@ class ImageCanvas(QGraphicsView):
                         self.selected_roi_index = roi_idx
                         self.selected_vertex_index = vertex_idx
                         self.drag_start_pos = scene_pos
+                        self.last_drag_pixel = scene_pos.toPoint()
                         return
                     
                     roi_idx = main_window.find_roi_at(scene_pos)
@@ -188,6 +240,7 @@ class ImageCanvas(QGraphicsView):
                         self.dragging_roi = True
                         self.selected_roi_index = roi_idx
                         self.drag_start_pos = scene_pos
+                        self.last_drag_pixel = scene_pos.toPoint()
                         return
                 
                 self.roi_point_added.emit(scene_pos)
@@ -214,6 +267,7 @@ class ImageCanvas(QGraphicsView):
                         self.dragging_marker = True
                         self.selected_marker_index = marker_idx
                         self.drag_start_pos = scene_pos
+                        self.last_drag_pixel = scene_pos.toPoint()
                         self.setCursor(Qt.CursorShape.SizeAllCursor)
                         return
                     else:
@@ -233,17 +287,21 @@ class ImageCanvas(QGraphicsView):
         scene_pos = self.mapToScene(event.pos())
         
         if self.dragging_vertex and self.selected_roi_index >= 0:
-            self.roi_vertex_moved.emit(self.selected_roi_index, self.selected_vertex_index, scene_pos)
+            if self._drag_pixel_changed(scene_pos):
+                self.roi_vertex_moved.emit(self.selected_roi_index, self.selected_vertex_index, scene_pos)
             return
         
         if self.dragging_roi and self.selected_roi_index >= 0 and self.drag_start_pos:
-            delta = scene_pos - self.drag_start_pos
-            self.roi_moved.emit(self.selected_roi_index, delta)
-            self.drag_start_pos = scene_pos
+            # drag_start_pos only advances on emit, so skipped moves accumulate into the next delta
+            if self._drag_pixel_changed(scene_pos):
+                delta = scene_pos - self.drag_start_pos
+                self.roi_moved.emit(self.selected_roi_index, delta)
+                self.drag_start_pos = scene_pos
             return
         
         if self.dragging_marker and self.selected_marker_index >= 0:
-            self.marker_moved.emit(self.selected_marker_index, scene_pos)
+            if self._drag_pixel_changed(scene_pos):
+                self.marker_moved.emit(self.selected_marker_index, scene_pos)
             return
         
         if self.right_click_panning and self.pan_start_pos:
@@ -258,15 +316,14 @@ class ImageCanvas(QGraphicsView):
             return
         
         if self.tool_mode == ToolMode.ROI_DRAW and self.last_roi_point:
-            self.clear_temp_line()
-            pen = QPen(QColor(255, 255, 0, 180))
-            pen.setWidth(2)
-            pen.setStyle(Qt.PenStyle.DashLine)
-            self.temp_line = self.scene.addLine(
-                self.last_roi_point.x(), self.last_roi_point.y(),
-                scene_pos.x(), scene_pos.y(),
-                pen
-            )
+            line = self.temp_line.line()
+            moved = abs(line.x2() - scene_pos.x()) + abs(line.y2() - scene_pos.y())
+            if moved >= 0.5 or line.p1() != self.last_roi_point or not self.temp_line.isVisible():
+                self.temp_line.setLine(
+                    self.last_roi_point.x(), self.last_roi_point.y(),
+                    scene_pos.x(), scene_pos.y()
+                )
+                self.temp_line.setVisible(True)
         
         super().mouseMoveEvent(event)
     
@@ -278,9 +335,11 @@ class ImageCanvas(QGraphicsView):
             self.selected_roi_index = -1
             self.selected_vertex_index = -1
             self.drag_start_pos = None
+            self.last_drag_pixel = None
         elif event.button() == Qt.MouseButton.RightButton:
             self.dragging_marker = False
             self.selected_marker_index = -1
+            self.last_drag_pixel = None
             self.right_click_panning = False
             self.pan_start_pos = None
             if self.tool_mode == ToolMode.PAN:
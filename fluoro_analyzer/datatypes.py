@@ -3,12 +3,14 @@ Data types for Fluorescence Microscope Image Analyzer.
 Contains enums and dataclasses used throughout the application.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
+import numpy as np
 from PyQt6.QtCore import QPointF
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QPolygonF
 
 
 class ChannelMode(Enum):
@@ -48,20 +50,52 @@ class ToolMode(Enum):
     ROI_DRAW = auto()
 
 
-@dataclass
+def _packed_color_property():
+    """Expose a packed 0xAARRGGBB color_argb field as a QColor attribute."""
+    def getter(self):
+        return QColor.fromRgba(self.color_argb)
+    
+    def setter(self, color: QColor):
+        self.color_argb = color.rgba()
+    
+    return property(getter, setter)
+
+
+def _packed_rgb(argb: int) -> tuple:
+    """Unpack 0xAARRGGBB into an (r, g, b) tuple."""
+    return ((argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF)
+
+
+@dataclass(slots=True)
 class CellType:
-    """Represents a cell type for counting."""
+    """Represents a cell type for counting.
+    
+    The color is stored packed as 0xAARRGGBB (QColor.rgba()); color gives
+    it as a QColor and rgb as a tuple.
+    """
     name: str
-    color: QColor
+    color_argb: int
     marker_type: MarkerType
     marker_size: int
     label_position: LabelPosition = LabelPosition.RIGHT
     label_size: int = 12
     label_offset: int = 2
     count: int = 0
+    
+    color = _packed_color_property()
+    
+    @property
+    def rgb(self) -> tuple:
+        """The color as an (r, g, b) tuple."""
+        return _packed_rgb(self.color_argb)
+    
+    @classmethod
+    def from_qcolor(cls, name: str, color: QColor, *args, **kwargs) -> "CellType":
+        """Create a cell type from a QColor."""
+        return cls(name, color.rgba(), *args, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class CellMarker:
     """Represents a single cell marker."""
     position: QPointF
@@ -70,87 +104,353 @@ class CellMarker:
     roi_name: Optional[str] = None
 
 
-@dataclass
+class MarkerStore:
+    """Stores cell markers as parallel arrays (one row per marker).
+    
+    Positions, cell types and marker numbers live in numpy arrays so
+    hit-testing, counting and renumbering are vectorised. Cell types are
+    stored as indices into type_names, so renaming a type is a single
+    assignment. Iterating yields CellMarker snapshots; changes must go
+    through the store's methods.
+    """
+    
+    _INITIAL_CAPACITY = 64
+    
+    def __init__(self):
+        self._positions = np.empty((self._INITIAL_CAPACITY, 2), dtype=np.float64)
+        self._type_idx = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._number = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._count = 0
+        self.roi_names: list[Optional[str]] = []
+        self.type_names: list[str] = []
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        return iter(self.snapshot_markers())
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 2) array of marker x, y positions."""
+        return self._positions[:self._count]
+    
+    @property
+    def type_idx(self) -> np.ndarray:
+        """(N,) array of indices into type_names."""
+        return self._type_idx[:self._count]
+    
+    @property
+    def number(self) -> np.ndarray:
+        """(N,) array of per-type marker numbers."""
+        return self._number[:self._count]
+    
+    def _reserve(self, size: int):
+        """Grow the arrays (doubling) so they can hold size markers."""
+        capacity = len(self._number)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ("_positions", "_type_idx", "_number"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
+    
+    def type_index(self, name: str) -> int:
+        """Return the index of a cell type name, registering it if new."""
+        try:
+            return self.type_names.index(name)
+        except ValueError:
+            self.type_names.append(name)
+            return len(self.type_names) - 1
+    
+    def type_mask(self, name: str) -> np.ndarray:
+        """Return a boolean mask of the markers of a cell type."""
+        if name not in self.type_names:
+            return np.zeros(self._count, dtype=bool)
+        return self.type_idx == self.type_names.index(name)
+    
+    def count_of_type(self, name: str) -> int:
+        """Return the number of markers of a cell type."""
+        return int(np.count_nonzero(self.type_mask(name)))
+    
+    def counts_by_type(self) -> dict:
+        """Return marker counts keyed by cell type name."""
+        counts = np.bincount(self.type_idx, minlength=len(self.type_names))
+        return {name: int(count) for name, count in zip(self.type_names, counts)}
+    
+    def append(self, x: float, y: float, cell_type: str, number: int, roi_name: Optional[str] = None) -> int:
+        """Add a marker and return its index."""
+        self._reserve(self._count + 1)
+        i = self._count
+        self._positions[i] = (x, y)
+        self._type_idx[i] = self.type_index(cell_type)
+        self._number[i] = number
+        self.roi_names.append(roi_name)
+        self._count += 1
+        return i
+    
+    def extend(self, positions: np.ndarray, cell_types: list, numbers, roi_names: list):
+        """
+        Add many markers at once.
+        
+        Args:
+            positions: (K, 2) array of x, y positions
+            cell_types: K cell type names
+            numbers: K per-type marker numbers, or one number for all of them
+            roi_names: K ROI names (None for unassigned)
+        """
+        k = len(cell_types)
+        index_of = {name: self.type_index(name) for name in dict.fromkeys(cell_types)}
+        self._reserve(self._count + k)
+        i = self._count
+        self._positions[i:i + k] = positions
+        self._type_idx[i:i + k] = [index_of[name] for name in cell_types]
+        self._number[i:i + k] = numbers
+        self.roi_names.extend(roi_names)
+        self._count += k
+    
+    def push(self, marker: CellMarker) -> int:
+        """Add a CellMarker (e.g. from the undo stack or an import) and return its index."""
+        return self.append(
+            marker.position.x(), marker.position.y(),
+            marker.cell_type, marker.marker_number, marker.roi_name
+        )
+    
+    def marker(self, i: int) -> CellMarker:
+        """Return a CellMarker snapshot of marker i."""
+        x, y = self._positions[i].tolist()
+        return CellMarker(
+            QPointF(x, y), self.type_names[self._type_idx[i]], int(self._number[i]), self.roi_names[i]
+        )
+    
+    def snapshot_markers(self) -> list:
+        """Return CellMarker snapshots of all markers, e.g. for export."""
+        return [
+            CellMarker(QPointF(x, y), self.type_names[t], number, roi_name)
+            for (x, y), t, number, roi_name in zip(
+                self.positions.tolist(), self.type_idx.tolist(), self.number.tolist(), self.roi_names
+            )
+        ]
+    
+    def pop(self, i: int = -1) -> CellMarker:
+        """Remove marker i (default: the last one) and return it as a CellMarker."""
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("marker index out of range")
+        marker = self.marker(i)
+        n = self._count
+        self._positions[i:n - 1] = self._positions[i + 1:n]
+        self._type_idx[i:n - 1] = self._type_idx[i + 1:n]
+        self._number[i:n - 1] = self._number[i + 1:n]
+        del self.roi_names[i]
+        self._count -= 1
+        return marker
+    
+    def clear(self):
+        """Remove all markers."""
+        self._count = 0
+        self.roi_names.clear()
+    
+    def set_position(self, i: int, x: float, y: float):
+        """Move marker i to (x, y)."""
+        self._positions[i] = (x, y)
+    
+    def find_near(self, x: float, y: float, radius: float) -> int:
+        """Return the index of the first marker closer than radius to (x, y), or -1."""
+        dx = self.positions[:, 0] - x
+        dy = self.positions[:, 1] - y
+        hits = np.flatnonzero(dx * dx + dy * dy < radius * radius)
+        return int(hits[0]) if len(hits) else -1
+    
+    def renumber_type(self, name: str):
+        """Renumber the markers of a cell type 1..n in list order."""
+        mask = self.type_mask(name)
+        self.number[mask] = np.arange(1, np.count_nonzero(mask) + 1)
+    
+    def rename_type(self, old_name: str, new_name: str):
+        """Move all markers of one cell type name to another."""
+        if old_name not in self.type_names:
+            return
+        old = self.type_names.index(old_name)
+        if new_name in self.type_names:
+            self.type_idx[self.type_idx == old] = self.type_names.index(new_name)
+        else:
+            self.type_names[old] = new_name
+    
+    def remove_type(self, name: str):
+        """Remove all markers of a cell type."""
+        keep = ~self.type_mask(name)
+        kept = int(np.count_nonzero(keep))
+        self._positions[:kept] = self.positions[keep]
+        self._type_idx[:kept] = self.type_idx[keep]
+        self._number[:kept] = self.number[keep]
+        self.roi_names = [roi_name for roi_name, k in zip(self.roi_names, keep.tolist()) if k]
+        self._count = kept
+    
+    def rename_roi(self, old_name: str, new_name: Optional[str]):
+        """Reassign markers from one ROI name to another (None to unassign)."""
+        self.roi_names = [new_name if roi_name == old_name else roi_name for roi_name in self.roi_names]
+    
+    def roi_counts(self) -> dict:
+        """Return counts of markers inside ROIs keyed by (cell type, ROI name)."""
+        # Tally (type index, ROI name) pairs in C, then name the few distinct groups
+        pairs = Counter(zip(self.type_idx.tolist(), self.roi_names))
+        return {(self.type_names[t], roi_name): n for (t, roi_name), n in pairs.items() if roi_name}
+
+
+@dataclass(eq=False, slots=True)
 class ROI:
-    """Represents a Region of Interest."""
+    """Represents a Region of Interest.
+    
+    Vertices are kept in a growable (V, 2) array so moving an ROI is a
+    single vectorised addition; points gives them as (x, y) tuples. The
+    color is stored packed as 0xAARRGGBB, like CellType.
+    
+    ROIs compare by identity: two ROIs with the same name and vertices are
+    still different objects (the vertex array cannot be compared with ==).
+    """
     name: str
-    points: list = field(default_factory=list)
-    color: QColor = field(default_factory=lambda: QColor(255, 255, 0, 255))
+    color_argb: int = 0xFFFFFF00
     line_width: int = 2
     closed: bool = False
+    _vertices: np.ndarray = field(
+        default_factory=lambda: np.empty((8, 2), dtype=np.float64), init=False, repr=False
+    )
+    _len: int = field(default=0, init=False, repr=False)
+    
+    color = _packed_color_property()
+    
+    @property
+    def rgb(self) -> tuple:
+        """The color as an (r, g, b) tuple."""
+        return _packed_rgb(self.color_argb)
+    
+    @property
+    def vertices(self) -> np.ndarray:
+        """(V, 2) array of vertex x, y positions."""
+        return self._vertices[:self._len]
+    
+    @property
+    def num_points(self) -> int:
+        """Number of vertices."""
+        return self._len
+    
+    @property
+    def points(self) -> list:
+        """Vertices as a list of (x, y) tuples."""
+        return [tuple(p) for p in self.vertices.tolist()]
+    
+    def append_point(self, x: float, y: float):
+        """Add a vertex, doubling the array capacity when it is full."""
+        if self._len == len(self._vertices):
+            grown = np.empty((2 * len(self._vertices), 2), dtype=self._vertices.dtype)
+            grown[:self._len] = self._vertices
+            self._vertices = grown
+        self._vertices[self._len] = (x, y)
+        self._len += 1
+    
+    def set_vertex(self, index: int, x: float, y: float):
+        """Move one vertex."""
+        self.vertices[index] = (x, y)
+    
+    def translate(self, dx: float, dy: float):
+        """Move every vertex by (dx, dy)."""
+        self._vertices[:self._len] += (dx, dy)
+    
+    def polygon(self) -> QPolygonF:
+        """Return the vertices as a QPolygonF."""
+        return QPolygonF([QPointF(x, y) for x, y in self.vertices.tolist()])
+
 
+def _channel_property(array_name: str, index: int, cast):
+    """Expose one element of a per-channel adjustment array as a scalar attribute."""
+    def getter(self):
+        return cast(getattr(self, array_name)[index])
+    
+    def setter(self, value):
+        getattr(self, array_name)[index] = value
+    
+    return property(getter, setter)
 
-@dataclass
+
+@dataclass(eq=False, slots=True)
 class ImageAdjustments:
-    """Stores per-channel image adjustment settings."""
+    """Stores per-channel image adjustment settings.
+    
+    Each adjustment is a length-3 array in (R, G, B) order so processing can
+    use it directly; brightness_r, contrast_g, etc. read and write single
+    elements.
+    """
     # Brightness: -100 to 100
-    brightness_r: int = 0
-    brightness_g: int = 0
-    brightness_b: int = 0
+    brightness: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.int16))
     
     # Contrast: 0.1 to 3.0
-    contrast_r: float = 1.0
-    contrast_g: float = 1.0
-    contrast_b: float = 1.0
+    contrast: np.ndarray = field(default_factory=lambda: np.ones(3, dtype=np.float64))
     
     # Noise reduction strength per channel: 0 to 10
-    noise_r: int = 0
-    noise_g: int = 0
-    noise_b: int = 0
+    noise: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.uint8))
+    
+    brightness_r = _channel_property("brightness", 0, int)
+    brightness_g = _channel_property("brightness", 1, int)
+    brightness_b = _channel_property("brightness", 2, int)
+    contrast_r = _channel_property("contrast", 0, float)
+    contrast_g = _channel_property("contrast", 1, float)
+    contrast_b = _channel_property("contrast", 2, float)
+    noise_r = _channel_property("noise", 0, int)
+    noise_g = _channel_property("noise", 1, int)
+    noise_b = _channel_property("noise", 2, int)
     
     def reset_brightness_r(self):
         """Reset red brightness."""
-        self.brightness_r = 0
+        self.brightness[0] = 0
     
     def reset_brightness_g(self):
         """Reset green brightness."""
-        self.brightness_g = 0
+        self.brightness[1] = 0
     
     def reset_brightness_b(self):
         """Reset blue brightness."""
-        self.brightness_b = 0
+        self.brightness[2] = 0
     
     def reset_brightness(self):
         """Reset all brightness values."""
-        self.brightness_r = 0
-        self.brightness_g = 0
-        self.brightness_b = 0
+        self.brightness[:] = 0
     
     def reset_contrast_r(self):
         """Reset red contrast."""
-        self.contrast_r = 1.0
+        self.contrast[0] = 1.0
     
     def reset_contrast_g(self):
         """Reset green contrast."""
-        self.contrast_g = 1.0
+        self.contrast[1] = 1.0
     
     def reset_contrast_b(self):
         """Reset blue contrast."""
-        self.contrast_b = 1.0
+        self.contrast[2] = 1.0
     
     def reset_contrast(self):
         """Reset all contrast values."""
-        self.contrast_r = 1.0
-        self.contrast_g = 1.0
-        self.contrast_b = 1.0
+        self.contrast[:] = 1.0
     
     def reset_noise_r(self):
         """Reset red noise reduction."""
-        self.noise_r = 0
+        self.noise[0] = 0
     
     def reset_noise_g(self):
         """Reset green noise reduction."""
-        self.noise_g = 0
+        self.noise[1] = 0
     
     def reset_noise_b(self):
         """Reset blue noise reduction."""
-        self.noise_b = 0
+        self.noise[2] = 0
     
     def reset_noise(self):
         """Reset all noise reduction."""
-        self.noise_r = 0
-        self.noise_g = 0
-        self.noise_b = 0
+        self.noise[:] = 0
     
     def reset_all(self):
         """Reset all adjustments."""
@@ -158,16 +458,30 @@ class ImageAdjustments:
         self.reset_contrast()
         self.reset_noise()
     
+    def is_identity(self) -> bool:
+        """Return True if no adjustment changes the image."""
+        return not self.brightness.any() and (self.contrast == 1.0).all() and not self.noise.any()
+    
+    def as_tuple(self) -> tuple:
+        """Return all adjustment values as a hashable tuple."""
+        return (
+            *self.brightness.tolist(),
+            *self.contrast.tolist(),
+            *self.noise.tolist()
+        )
+    
+    def __eq__(self, other):
+        if not isinstance(other, ImageAdjustments):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+    
+    # Mutable (sliders edit it in place), so not hashable; key caches on as_tuple()
+    __hash__ = None
+    
     def copy(self):
         """Create a copy of the adjustments."""
         return ImageAdjustments(
-            brightness_r=self.brightness_r,
-            brightness_g=self.brightness_g,
-            brightness_b=self.brightness_b,
-            contrast_r=self.contrast_r,
-            contrast_g=self.contrast_g,
-            contrast_b=self.contrast_b,
-            noise_r=self.noise_r,
-            noise_g=self.noise_g,
-            noise_b=self.noise_b
-        )
\ No newline at end of file
+            brightness=self.brightness.copy(),
+            contrast=self.contrast.copy(),
+            noise=self.noise.copy()
+        )
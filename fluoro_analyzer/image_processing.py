@@ -3,14 +3,94 @@ Image processing functions for Fluorescence Microscope Image Analyzer.
 Contains brightness, contrast, and noise reduction functions.
 """
 
+import functools
+import threading
+from collections import OrderedDict
+
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
+
+from .image_processing_gpu import HAS_CUPY, adjust_on_gpu, release_gpu_image
+from .image_processing_numba import HAS_NUMBA, lut_rgb
+
+# Every uint8 value, used as the input when building lookup tables
+_IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+
+# Recently adjusted images: (id(image), adjustment values) -> (image, result)
+_RESULT_CACHE_SIZE = 4
+_result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_result_cache_lock = threading.Lock()  # Adjustments also run on a worker thread
+
+# Most recent full-size result, (image, result): the base that viewport-only
+# (roi) updates are composed onto. Guarded by _result_cache_lock.
+_last_result: Optional[tuple] = None
+
+# Working buffer roi updates are written into, so each update only copies its
+# region once _last_result points at it. Never cached or shared with the
+# result cache. Guarded by _result_cache_lock.
+_roi_buffer: Optional[np.ndarray] = None
+
+# Below this sigma the neighbour weights are ~1e-5: the blur cannot visibly
+# smooth anything and only truncation to uint8 would change pixels
+_MIN_NOISE_SIGMA = 0.3
+
+# scipy.ndimage, imported on first use because it adds noticeably to startup
+# time (None: not imported yet, False: scipy is not installed)
+_ndimage = None
+
+
+def load_ndimage():
+    """Import scipy.ndimage if it has not been imported yet; return it, or False if unavailable."""
+    global _ndimage
+    if _ndimage is None:
+        try:
+            from scipy import ndimage
+            _ndimage = ndimage
+        except ImportError:
+            _ndimage = False
+    return _ndimage
+
+
+def _brightness_float(values: np.ndarray, brightness: int) -> np.ndarray:
+    """Brightness shift computed in float32 (used for non-uint8 data)."""
+    # Scale from -100,100 to actual pixel shift (roughly -255 to 255)
+    adjusted = values.astype(np.float32) + (brightness * 2.55)
+    return np.clip(adjusted, 0, 255).astype(np.uint8)
+
+
+def _contrast_float(values: np.ndarray, contrast: float) -> np.ndarray:
+    """Contrast stretch around the midpoint (128) computed in float32."""
+    midpoint = 128.0
+    adjusted = (values.astype(np.float32) - midpoint) * contrast + midpoint
+    return np.clip(adjusted, 0, 255).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_channel_luts(brightness: tuple, contrast: tuple) -> np.ndarray:
+    """
+    Build the (channels, 256) lookup tables for all channels at once.
+    
+    Every possible uint8 value is run through the float32 brightness and
+    contrast formulas once per channel, so a single gather gives exactly the
+    same result as the two float passes over the whole image.
+    
+    Args:
+        brightness: Brightness value per channel
+        contrast: Contrast value per channel
+    """
+    shift = (np.array(brightness, dtype=np.float64) * 2.55).astype(np.float32)[:, None]
+    gain = np.array(contrast, dtype=np.float32)[:, None]
+    midpoint = np.float32(128.0)
+    
+    luts = np.clip(_IDENTITY_LUT.astype(np.float32) + shift, 0, 255).astype(np.uint8)
+    luts = np.clip((luts.astype(np.float32) - midpoint) * gain + midpoint, 0, 255).astype(np.uint8)
+    luts.setflags(write=False)  # Shared between calls via the cache
+    return luts
 
-try:
-    from scipy import ndimage
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
+
+def _build_lut(brightness: int, contrast: float) -> np.ndarray:
+    """Build the 256-entry lookup table for a single channel."""
+    return _build_channel_luts((brightness,), (contrast,))[0]
 
 
 def apply_brightness(channel: np.ndarray, brightness: int) -> np.ndarray:
@@ -26,15 +106,9 @@ def apply_brightness(channel: np.ndarray, brightness: int) -> np.ndarray:
     """
     if brightness == 0:
         return channel
-    
-    # Convert to float for calculation
-    adjusted = channel.astype(np.float32)
-    
-    # Apply brightness (scale from -100,100 to actual pixel shift)
-    adjusted = adjusted + (brightness * 2.55)  # Scale to roughly -255 to 255
-    
-    # Clip and convert back
-    return np.clip(adjusted, 0, 255).astype(np.uint8)
+    if channel.dtype == np.uint8:
+        return _build_lut(brightness, 1.0)[channel]
+    return _brightness_float(channel, brightness)
 
 
 def apply_contrast(channel: np.ndarray, contrast: float) -> np.ndarray:
@@ -50,16 +124,30 @@ def apply_contrast(channel: np.ndarray, contrast: float) -> np.ndarray:
     """
     if contrast == 1.0:
         return channel
+    if channel.dtype == np.uint8:
+        return _build_lut(0, contrast)[channel]
+    return _contrast_float(channel, contrast)
+
+
+@functools.lru_cache(maxsize=32)
+def _noise_kernel(strength: int) -> Optional[np.ndarray]:
+    """
+    Build the normalized 1-D Gaussian weights for a noise reduction strength.
     
-    # Convert to float for calculation
-    adjusted = channel.astype(np.float32)
-    
-    # Apply contrast around midpoint (128)
-    midpoint = 128.0
-    adjusted = (adjusted - midpoint) * contrast + midpoint
-    
-    # Clip and convert back
-    return np.clip(adjusted, 0, 255).astype(np.uint8)
+    Uses the same sigma, truncation (4 sigma) and normalization as
+    scipy.ndimage.gaussian_filter, so the separable passes match it exactly.
+    Returns None when the blur would be a no-op.
+    """
+    # Convert strength to sigma (0-10 maps to 0-2.0 sigma)
+    sigma = strength * 0.2
+    if sigma < _MIN_NOISE_SIGMA:
+        return None
+    radius = int(4.0 * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    weights = np.exp(-0.5 / (sigma * sigma) * x ** 2)
+    weights /= weights.sum()
+    weights.setflags(write=False)  # Shared between calls via the cache
+    return weights
 
 
 def apply_noise_reduction_channel(channel: np.ndarray, strength: int) -> np.ndarray:
@@ -73,55 +161,247 @@ def apply_noise_reduction_channel(channel: np.ndarray, strength: int) -> np.ndar
     Returns:
         Filtered channel
     """
-    if strength == 0:
+    weights = _noise_kernel(strength)
+    if weights is None:
         return channel
     
-    if not HAS_SCIPY:
+    ndimage = load_ndimage()
+    if not ndimage:
         # Fallback: return unchanged if scipy not available
         return channel
     
-    # Convert strength to sigma (0-10 maps to 0-2.0 sigma)
-    sigma = strength * 0.2
+    # Separable blur: one pass down the rows, one across the columns
+    blurred = ndimage.correlate1d(channel, weights, axis=0, mode='reflect')
+    blurred = ndimage.correlate1d(blurred, weights, axis=1, mode='reflect')
+    return blurred.astype(np.uint8, copy=False)
+
+
+def apply_noise_reduction_rgb(image: np.ndarray, strength_r: int, strength_g: int,
+                              strength_b: int) -> np.ndarray:
+    """
+    Apply noise reduction to the channels of an RGB image.
+    
+    Args:
+        image: 3D numpy array (H, W, 3) RGB image
+        strength_r, strength_g, strength_b: Per-channel values from 0 to 10
     
-    return ndimage.gaussian_filter(channel, sigma=sigma).astype(np.uint8)
+    Returns:
+        Filtered image. Channels whose blur would be a no-op are copied without
+        filtering, and the input is returned unchanged if no channel needs it.
+    """
+    strengths = (strength_r, strength_g, strength_b)
+    active = [_noise_kernel(s) is not None for s in strengths]
+    if not any(active):
+        return image
+    
+    result = image.copy()
+    for c, strength in enumerate(strengths):
+        if active[c]:
+            result[:, :, c] = apply_noise_reduction_channel(image[:, :, c], strength)
+    return result
+
+
+def downsample_image(image: np.ndarray, factor: int = 2) -> np.ndarray:
+    """
+    Downsample an image by averaging factor x factor pixel blocks.
+    
+    Args:
+        image: 2D or 3D numpy array
+        factor: Integer reduction factor per axis
+    
+    Returns:
+        Contiguous downsampled image with the same dtype. Trailing rows and
+        columns that do not fill a whole block are dropped.
+    """
+    h = image.shape[0] // factor * factor
+    w = image.shape[1] // factor * factor
+    blocks = image[:h, :w].reshape(h // factor, factor, w // factor, factor, *image.shape[2:])
+    return blocks.mean(axis=(1, 3)).astype(image.dtype)
+
+
+def to_uint8(image: np.ndarray) -> np.ndarray:
+    """
+    Convert an image to uint8, stretching its value range to 0-255 if it exceeds 255.
+    
+    Args:
+        image: numpy array of any numeric dtype
+    
+    Returns:
+        uint8 array. Images whose maximum is 255 or less are cast unchanged.
+    """
+    if image.dtype == np.uint8:
+        return image
+    hi = image.max()
+    if hi <= 255:
+        return image.astype(np.uint8)
+    lo = image.min()
+    if image.dtype == np.uint16:
+        # One table entry per possible value: a gather writes the uint8 result
+        # directly instead of building full-size float64 temporaries
+        lut = ((np.arange(int(hi) + 1) - lo) / (hi - lo) * 255).astype(np.uint8)
+        return lut[image]
+    scaled = (image - lo) / (hi - lo)
+    scaled *= 255
+    return scaled.astype(np.uint8)
+
+
+def clear_adjustment_cache():
+    """Drop all cached adjustment results (call when a new image is loaded)."""
+    global _last_result, _roi_buffer
+    with _result_cache_lock:
+        _result_cache.clear()
+        _last_result = None
+        _roi_buffer = None
+    if HAS_CUPY:
+        release_gpu_image()
 
 
-def apply_all_adjustments(image: np.ndarray, adjustments) -> np.ndarray:
+def apply_all_adjustments(image: np.ndarray, adjustments,
+                          roi: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
     """
     Apply all image adjustments.
     
     Args:
         image: 3D numpy array (H, W, 3) RGB image
         adjustments: ImageAdjustments object
+        roi: Optional (x0, y0, x1, y1) region to update, e.g. the visible part
+            of the image while a slider is dragged. Only this region is
+            adjusted; the rest of the returned image is kept from the
+            previous result for the same image. Ignored (the whole image is
+            adjusted) when there is no previous result or the region covers
+            the whole image.
     
     Returns:
-        Adjusted image
+        Adjusted image. Results are cached and shared between calls with the
+        same image and adjustment values, so callers must not modify it.
+        A region update returns a working buffer that the next region update
+        overwrites, so copy it (e.g. into a pixmap) before requesting another.
     """
     if image is None or image.ndim != 3 or image.shape[2] < 3:
         return image
     
-    result = image.copy()
+    if adjustments.is_identity():
+        with _result_cache_lock:
+            _set_last_result(image, image)
+        return image  # Nothing to do; the input is passed through untouched
+    
+    if roi is not None:
+        result = _apply_adjustments_roi(image, adjustments, roi)
+        if result is not None:
+            return result
+    
+    key = (id(image), adjustments.as_tuple())
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None and cached[0] is image:
+            _result_cache.move_to_end(key)
+            _set_last_result(image, cached[1])
+            return cached[1]
+    
+    result = _adjust(image, adjustments)
+    return _store_result(key, image, result)
+
+
+def _apply_adjustments_roi(image: np.ndarray, adjustments, roi: tuple) -> Optional[np.ndarray]:
+    """
+    Adjust only a region of an image and compose it onto the previous result.
+    
+    Returns None if the whole image has to be adjusted instead.
+    """
+    height, width = image.shape[:2]
+    x0, y0, x1, y1 = roi
+    x0, x1 = max(0, min(x0, width)), max(0, min(x1, width))
+    y0, y1 = max(0, min(y0, height)), max(0, min(y1, height))
+    if x0 >= x1 or y0 >= y1 or (x1 - x0) * (y1 - y0) == width * height:
+        return None
+    
+    global _roi_buffer
+    with _result_cache_lock:
+        last, buffer = _last_result, _roi_buffer
+    if last is None or last[0] is not image:
+        return None
+    
+    # Extend the crop by the blur radius so the blur inside the region matches
+    # the full-image result (reflection only happens at the real image edges)
+    kernels = [_noise_kernel(strength) for strength in adjustments.noise.tolist()]
+    margin = max((len(weights) // 2 for weights in kernels if weights is not None), default=0)
+    cy0, cx0 = max(0, y0 - margin), max(0, x0 - margin)
+    cy1, cx1 = min(height, y1 + margin), min(width, x1 + margin)
+    crop = np.ascontiguousarray(image[cy0:cy1, cx0:cx1])
+    adjusted = _adjust(crop, adjustments, use_gpu=False)  # Keep the full image resident on the GPU
+    
+    base = last[1]
+    if buffer is not base:
+        # First region update since a full result: start from a copy of it
+        if buffer is None or buffer.shape != base.shape or buffer.dtype != base.dtype:
+            buffer = np.empty_like(base)
+        np.copyto(buffer, base)
+    buffer[y0:y1, x0:x1] = adjusted[y0 - cy0:y1 - cy0, x0 - cx0:x1 - cx0]
+    with _result_cache_lock:
+        _roi_buffer = buffer
+        _set_last_result(image, buffer)
+    return buffer
+
+
+def _adjust(image: np.ndarray, adjustments, use_gpu: bool = True) -> np.ndarray:
+    """Apply brightness, contrast and noise reduction to an RGB image without caching."""
+    brightness, contrast, noise = adjustments.brightness, adjustments.contrast, adjustments.noise
+    
+    use_lut = image.dtype == np.uint8
+    needs_bc = brightness.any() or (contrast != 1.0).any()  # False when only noise is set
     
-    # Apply per-channel brightness, contrast, and noise reduction
-    # Red channel
-    r = result[:, :, 0]
-    r = apply_brightness(r, adjustments.brightness_r)
-    r = apply_contrast(r, adjustments.contrast_r)
-    r = apply_noise_reduction_channel(r, adjustments.noise_r)
-    result[:, :, 0] = r
-    
-    # Green channel
-    g = result[:, :, 1]
-    g = apply_brightness(g, adjustments.brightness_g)
-    g = apply_contrast(g, adjustments.contrast_g)
-    g = apply_noise_reduction_channel(g, adjustments.noise_g)
-    result[:, :, 1] = g
-    
-    # Blue channel
-    b = result[:, :, 2]
-    b = apply_brightness(b, adjustments.brightness_b)
-    b = apply_contrast(b, adjustments.contrast_b)
-    b = apply_noise_reduction_channel(b, adjustments.noise_b)
-    result[:, :, 2] = b
+    # Brightness and contrast fused into one uint8 gather per channel
+    luts = None
+    if use_lut and needs_bc:
+        luts = _build_channel_luts(tuple(brightness.tolist()), tuple(contrast.tolist()))
     
+    if use_gpu and HAS_CUPY and use_lut and image.shape[2] == 3:
+        if luts is None:
+            luts = _build_channel_luts((0, 0, 0), (1.0, 1.0, 1.0))
+        kernels = [_noise_kernel(strength) for strength in noise.tolist()]
+        result = adjust_on_gpu(image, luts, kernels)
+    else:
+        result = np.empty(image.shape, dtype=image.dtype)  # C-contiguous for QImage
+        if image.shape[2] > 3:
+            result[:, :, 3:] = image[:, :, 3:]  # Extra channels pass through
+        
+        if luts is not None and HAS_NUMBA and image.shape[2] == 3:
+            # All three tables in one pass over the pixels, then noise reduction
+            lut_rgb(image, luts, result)
+            _reduce_noise_in_place(result, noise)
+        else:
+            # Apply per-channel brightness, contrast, and noise reduction
+            for c in range(3):
+                channel = image[:, :, c]
+                if brightness[c] != 0 or contrast[c] != 1.0:
+                    if luts is not None:
+                        channel = luts[c][channel]
+                    else:
+                        channel = apply_contrast(apply_brightness(channel, int(brightness[c])), float(contrast[c]))
+                result[:, :, c] = apply_noise_reduction_channel(channel, int(noise[c]))
+    
+    return result
+
+
+def _reduce_noise_in_place(result: np.ndarray, noise) -> np.ndarray:
+    """Blur the RGB channels of result that have noise reduction, skipping no-op strengths."""
+    for c in range(3):
+        if _noise_kernel(int(noise[c])) is not None:
+            result[:, :, c] = apply_noise_reduction_channel(result[:, :, c], int(noise[c]))
+    return result
+
+
+def _store_result(key: tuple, image: np.ndarray, result: np.ndarray) -> np.ndarray:
+    """Add an adjusted image to the result cache, evicting the oldest entry."""
+    with _result_cache_lock:
+        _result_cache[key] = (image, result)
+        _set_last_result(image, result)
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
     return result
+
+
+def _set_last_result(image: np.ndarray, result: np.ndarray):
+    """Record the newest full-size result for roi updates (call with _result_cache_lock held)."""
+    global _last_result
+    _last_result = (image, result)
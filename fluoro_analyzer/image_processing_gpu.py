@@ -0,0 +1,73 @@
+"""
+Optional GPU backend for Fluorescence Microscope Image Analyzer.
+Runs the brightness/contrast lookup and noise reduction with CuPy when a
+CUDA device is available. The lookup tables and blur weights are built by
+image_processing, so the GPU and CPU paths use the same tables and weights.
+"""
+
+import threading
+
+import numpy as np
+from typing import Optional
+
+try:
+    import cupy as xp
+    from cupyx.scipy import ndimage as xndimage
+    HAS_CUPY = xp.cuda.runtime.getDeviceCount() > 0
+except Exception:  # CuPy missing, or installed without a usable CUDA device
+    HAS_CUPY = False
+
+# Device copy of the most recently adjusted image, kept between slider ticks
+_resident_host: Optional[np.ndarray] = None
+_resident_device = None
+_resident_lock = threading.Lock()
+
+
+def _to_host(array) -> np.ndarray:
+    """Copy a device array back to host memory."""
+    return xp.asnumpy(array)
+
+
+def _device_image(image: np.ndarray):
+    """Return the device copy of an image, uploading it only when it changes."""
+    global _resident_host, _resident_device
+    with _resident_lock:
+        if _resident_host is not image:
+            _resident_device = xp.asarray(image)
+            _resident_host = image
+        return _resident_device
+
+
+def release_gpu_image():
+    """Free the device copy of the current image (call when a new image is loaded)."""
+    global _resident_host, _resident_device
+    with _resident_lock:
+        _resident_host = None
+        _resident_device = None
+
+
+def adjust_on_gpu(image: np.ndarray, luts: np.ndarray, kernels) -> np.ndarray:
+    """
+    Apply lookup tables and noise reduction to an RGB image on the GPU.
+
+    Args:
+        image: 3D uint8 numpy array (H, W, 3) RGB image
+        luts: (3, 256) uint8 lookup table per channel
+        kernels: Per-channel 1-D blur weights, or None to skip the blur
+
+    Returns:
+        Adjusted image as a host (numpy) uint8 array
+    """
+    device_image = _device_image(image)
+    device_luts = xp.asarray(luts)
+    result = xp.empty_like(device_image)
+
+    for c, weights in enumerate(kernels):
+        channel = device_luts[c][device_image[:, :, c]]
+        if weights is not None:
+            weights = xp.asarray(weights)
+            channel = xndimage.correlate1d(channel, weights, axis=0, output=xp.uint8, mode='reflect')
+            channel = xndimage.correlate1d(channel, weights, axis=1, output=xp.uint8, mode='reflect')
+        result[:, :, c] = channel
+
+    return _to_host(result)
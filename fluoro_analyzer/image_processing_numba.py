@@ -0,0 +1,59 @@
+"""
+Optional Numba kernels for Fluorescence Microscope Image Analyzer.
+Applies the per-channel lookup tables to uint8 images in a single pass.
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+    # The work queue layer is not threadsafe, so only fall back to it when
+    # neither OpenMP nor TBB is available
+    numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Kernels are launched from both the adjustment worker and the GUI thread
+# (e.g. exports); the parallel kernels already use every core, so launches
+# are serialized, which also keeps the work queue layer safe
+_launch_lock = threading.Lock()
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _lut_rgb(img, luts, out):
+        """Gather every pixel of a uint8 RGB image through its channel's table."""
+        height, width = img.shape[0], img.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                out[y, x, 0] = luts[0, img[y, x, 0]]
+                out[y, x, 1] = luts[1, img[y, x, 1]]
+                out[y, x, 2] = luts[2, img[y, x, 2]]
+
+
+def lut_rgb(image: np.ndarray, luts: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Apply per-channel lookup tables to a uint8 RGB image with Numba.
+
+    Args:
+        image: 3D uint8 numpy array (H, W, 3)
+        luts: (3, 256) uint8 lookup table per channel
+        out: uint8 array of the same shape as image to write the result into
+
+    Returns:
+        out
+    """
+    with _launch_lock:
+        _lut_rgb(image, luts, out)
+    return out
+
+
+def warm_up():
+    """Compile the kernels so the first real call is fast."""
+    if HAS_NUMBA:
+        dummy = np.zeros((2, 2, 3), dtype=np.uint8)
+        lut_rgb(dummy, np.zeros((3, 256), dtype=np.uint8), np.empty_like(dummy))
@@ -5,23 +5,25 @@ Main window for Fluorescence Microscope Image Analyzer.
 import csv
 import json
 import numpy as np
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QSpinBox,
-    QGraphicsEllipseItem, QGraphicsTextItem,
+    QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsTextItem,
     QFileDialog, QListWidget, QListWidgetItem, QGroupBox,
     QColorDialog, QMessageBox, QStatusBar, QToolBar, QSplitter,
     QScrollArea, QFrame, QLineEdit, QTableWidget, QTableWidgetItem,
     QHeaderView, QAbstractItemView, QInputDialog, QMenu, QCheckBox,
     QDialog, QDialogButtonBox, QApplication, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QPointF, QTimer
+from PyQt6.QtCore import Qt, QPointF, QThread, QTimer
 from PyQt6.QtGui import (
-    QImage, QPixmap, QColor, QPen, QBrush, QPolygonF,
-    QFont, QAction, QKeySequence, QShortcut, QScreen
+    QImage, QPixmap, QPixmapCache, QColor, QPen, QBrush,
+    QFont, QAction, QKeySequence, QShortcut, QScreen, QPainterPath
 )
 
 from PIL import Image
@@ -34,12 +36,176 @@ except ImportError:
 
 from .datatypes import (
     ChannelMode, MarkerType, ToolMode, LabelPosition,
-    CellType, CellMarker, ROI, ImageAdjustments
+    CellType, CellMarker, MarkerStore, ROI, ImageAdjustments
 )
 from .canvas import ImageCanvas
 from .widgets import CellTypeWidget
 from .adjustments_dialog import AdjustmentsDialog
-from .image_processing import apply_all_adjustments
+from .adjustment_worker import AdjustmentWorker
+from .image_processing import apply_all_adjustments, clear_adjustment_cache, downsample_image, to_uint8
+
+# Downsampling factor for the preview shown while an adjustment slider is dragged
+_PREVIEW_FACTOR = 2
+
+# TIFFs at least this large are memory-mapped instead of decoded into memory
+_TIFF_MEMMAP_MIN_BYTES = 256 << 20
+
+# Font for the labels drawn on exported overlay images
+_OVERLAY_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Red, green and blue checkbox states for each channel display mode
+_MODE_TO_RGB: dict[ChannelMode, tuple[bool, bool, bool]] = {
+    ChannelMode.COMPOSITE: (True, True, True),
+    ChannelMode.RED: (True, False, False),
+    ChannelMode.GREEN: (False, True, False),
+    ChannelMode.BLUE: (False, False, True),
+    ChannelMode.CYAN: (False, True, True),
+    ChannelMode.MAGENTA: (True, False, True),
+    ChannelMode.YELLOW: (True, True, False),
+}
+
+# Label placement per position, as coefficients of (marker size, label width,
+# label offset) added to the marker's x and of (marker size, label height,
+# label offset) added to its y. Unknown positions fall back to RIGHT.
+_LABEL_ANCHORS: dict[LabelPosition, tuple[tuple[float, float, float], tuple[float, float, float]]] = {
+    LabelPosition.RIGHT: ((0.5, 0, 1), (0, -0.5, 0)),
+    LabelPosition.LEFT: ((-0.5, -1, -1), (0, -0.5, 0)),
+    LabelPosition.TOP: ((0, -0.5, 0), (-0.5, -1, -1)),
+    LabelPosition.BOTTOM: ((0, -0.5, 0), (0.5, 0, 1)),
+    LabelPosition.TOP_RIGHT: ((0.5, 0, 1), (-0.5, -1, 0)),
+    LabelPosition.TOP_LEFT: ((-0.5, -1, -1), (-0.5, -1, 0)),
+    LabelPosition.BOTTOM_RIGHT: ((0.5, 0, 1), (0.5, 0, 0)),
+    LabelPosition.BOTTOM_LEFT: ((-0.5, -1, -1), (0.5, 0, 0)),
+}
+
+# Keyboard shortcuts: key sequence, attribute path of the slot on the window, slot arguments
+_SHORTCUTS = (
+    ('R', 'toggle_red_channel', ()),
+    ('G', 'toggle_green_channel', ()),
+    ('B', 'toggle_blue_channel', ()),
+    ('M', 'set_channel_mode', (ChannelMode.MAGENTA,)),
+    ('C', 'set_channel_mode', (ChannelMode.CYAN,)),
+    ('Y', 'set_channel_mode', (ChannelMode.YELLOW,)),
+    ('A', 'set_channel_mode', (ChannelMode.COMPOSITE,)),
+    ('Ctrl+O', 'open_file', ()),
+    ('Ctrl+Z', 'undo_last_marker', ()),
+    ('Ctrl+Shift+Z', 'redo_marker', ()),
+    ('Ctrl+S', 'export_all', ()),
+    ('Ctrl+Shift+S', 'skip_batch_image', ()),
+    ('Escape', 'handle_escape', ()),
+    ('Space', 'cycle_active_cell_type', ()),
+    ('F', 'set_tool_mode', (ToolMode.CELL_COUNT,)),
+    ('D', 'set_tool_mode', (ToolMode.ROI_DRAW,)),
+    ('E', 'set_tool_mode', (ToolMode.PAN,)),
+    ('V', 'canvas.reset_view', ()),
+    ('Shift+D', 'start_new_roi', ()),
+)
+
+# Per-channel checkbox rules, filled in for each (object name, color) below
+_CHANNEL_CHECKBOX_STYLE = """
+    QCheckBox#{name} {{ color: {color}; font-weight: bold; }}
+    QCheckBox#{name}::indicator {{ width: 22px; height: 22px; }}
+    QCheckBox#{name}::indicator:checked {{ background-color: {color}; border: 2px solid {color}; border-radius: 3px; }}
+    QCheckBox#{name}::indicator:unchecked {{ background-color: #3c3c3c; border: 2px solid {color}; border-radius: 3px; }}
+"""
+
+# Application stylesheet, parsed once for the whole window
+_DARK_THEME = """
+    QMainWindow, QWidget { background-color: #2b2b2b; color: #ffffff; }
+    QGroupBox { border: 1px solid #555; border-radius: 5px; margin-top: 10px; padding-top: 10px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+    QPushButton { background-color: #3c3c3c; border: 1px solid #555; border-radius: 4px; padding: 5px 10px; }
+    QPushButton:hover { background-color: #4a4a4a; }
+    QPushButton:pressed { background-color: #555555; }
+    QPushButton:checked { background-color: #0078d4; }
+    QComboBox, QLineEdit { background-color: #3c3c3c; border: 1px solid #555; border-radius: 3px; padding: 3px; }
+    QSpinBox, QDoubleSpinBox { 
+        background-color: #3c3c3c; 
+        border: 1px solid #555; 
+        border-radius: 3px; 
+        padding: 3px;
+        padding-right: 20px;
+    }
+    QSpinBox::up-button, QDoubleSpinBox::up-button {
+        subcontrol-origin: border;
+        subcontrol-position: top right;
+        width: 20px;
+        height: 12px;
+        border-left: 1px solid #555;
+        border-bottom: 1px solid #555;
+        border-top-right-radius: 3px;
+        background-color: #4a4a4a;
+    }
+    QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover {
+        background-color: #5a5a5a;
+    }
+    QSpinBox::up-button:pressed, QDoubleSpinBox::up-button:pressed {
+        background-color: #666666;
+    }
+    QSpinBox::down-button, QDoubleSpinBox::down-button {
+        subcontrol-origin: border;
+        subcontrol-position: bottom right;
+        width: 20px;
+        height: 12px;
+        border-left: 1px solid #555;
+        border-bottom-right-radius: 3px;
+        background-color: #4a4a4a;
+    }
+    QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
+        background-color: #5a5a5a;
+    }
+    QSpinBox::down-button:pressed, QDoubleSpinBox::down-button:pressed {
+        background-color: #666666;
+    }
+    QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
+        width: 10px;
+        height: 10px;
+    }
+    QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
+        width: 10px;
+        height: 10px;
+    }
+    QListWidget, QTableWidget { background-color: #3c3c3c; border: 1px solid #555; }
+    QScrollArea { border: none; }
+    QToolBar { background-color: #2b2b2b; border: none; spacing: 5px; padding: 5px; }
+    QStatusBar { background-color: #2b2b2b; }
+    QSlider::groove:horizontal { height: 6px; background: #3c3c3c; border-radius: 3px; }
+    QSlider::handle:horizontal { width: 14px; margin: -4px 0; background: #0078d4; border-radius: 7px; }
+""" + "".join(
+    _CHANNEL_CHECKBOX_STYLE.format(name=name, color=color)
+    for name, color in (("redCheck", "#ff6666"), ("greenCheck", "#66ff66"), ("blueCheck", "#6666ff"))
+)
+
+
+def _read_tiff(path: Path) -> np.ndarray:
+    """
+    Read a TIFF image, memory-mapping large files.
+    
+    A mapped file is paged in by the OS as it is read; the array is
+    read-only, which is fine since the display and adjustment pipelines
+    never modify their input. Compressed or tiled files cannot be mapped
+    and are decoded as usual.
+    """
+    if path.stat().st_size >= _TIFF_MEMMAP_MIN_BYTES:
+        try:
+            return tifffile.memmap(path, mode='r')
+        except ValueError:
+            pass  # Image data is not stored contiguously
+    return tifffile.imread(path)
+
+
+@lru_cache(maxsize=16)
+def _overlay_font(size: int):
+    """
+    Return the overlay export font at a pixel size, loaded once per size.
+    
+    Falls back to Pillow's built-in font when the TrueType font is missing.
+    """
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(_OVERLAY_FONT_PATH, size)
+    except (OSError, ValueError):
+        return ImageFont.load_default()
 
 
 class FluoroAnalyzer(QMainWindow):
@@ -53,14 +219,21 @@ class FluoroAnalyzer(QMainWindow):
         # Data
         self.image_data: Optional[np.ndarray] = None  # Original image data
         self.current_file: Optional[str] = None
+        self.current_path: Optional[Path] = None  # current_file, parsed once at load
         self.channel_mode = ChannelMode.COMPOSITE
         self.cell_types: dict[str, CellType] = {}
-        self.cell_markers: list[CellMarker] = []
-        self.marker_items: list = []
+        self.cell_markers = MarkerStore()
+        self.marker_items: list = []  # (shape, label) items per marker, None if its type is unknown
+        self._marker_styles: dict = {}  # (cell type name, selected) -> (pen, brush, font)
         self.rois: list[ROI] = []
         self.current_roi: Optional[ROI] = None
         self.roi_items: list = []
+        self.roi_item_groups: dict[int, list] = {}  # ROI index -> its line, vertex and label items
         self.current_cell_type: Optional[str] = None
+        self.cell_type_widgets: dict[str, CellTypeWidget] = {}  # Cell type name -> its panel widget
+        
+        # ROI hit-test geometry, rebuilt lazily when set to None
+        self._roi_geometry: Optional[tuple] = None  # See _roi_hit_geometry
         
         # Undo/Redo stacks
         self.undo_stack: list = []
@@ -84,6 +257,32 @@ class FluoroAnalyzer(QMainWindow):
         self.preserve_adjustments_on_load = True
         self.adjustments_dialog: Optional[AdjustmentsDialog] = None
         
+        # Half-resolution copy shown while an adjustment slider is dragged
+        self._preview_data: Optional[np.ndarray] = None
+        self._display_backing: Optional[np.ndarray] = None  # Memory behind the last display QImage
+        self._slider_dragging = False
+        
+        # Coalesce bursts of channel toggles (e.g. R/G/B shortcuts) into one redraw
+        self._channel_timer = QTimer(self)
+        self._channel_timer.setSingleShot(True)
+        self._channel_timer.setInterval(30)
+        self._channel_timer.timeout.connect(self.update_display)
+        
+        # Coalesce bursts of marker/ROI edits (e.g. a held undo key) into one table rebuild
+        self._results_timer = QTimer(self)
+        self._results_timer.setSingleShot(True)
+        self._results_timer.setInterval(30)
+        self._results_timer.timeout.connect(self._fill_results_table)
+        
+        # Background thread for slider-driven adjustments
+        self._adjust_thread = QThread(self)
+        self._adjust_worker = AdjustmentWorker()
+        self._adjust_worker.moveToThread(self._adjust_thread)
+        self._adjust_worker.result_ready.connect(self.on_adjusted_image_ready)
+        self._adjust_thread.started.connect(self._adjust_worker.warm_up)
+        self._adjust_thread.finished.connect(self._adjust_worker.deleteLater)
+        self._adjust_thread.start()
+        
         # Batch processing
         self.batch_files: list[str] = []
         self.batch_index: int = 0
@@ -184,34 +383,19 @@ class FluoroAnalyzer(QMainWindow):
         
         self.red_checkbox = QCheckBox("R")
         self.red_checkbox.setChecked(True)
-        self.red_checkbox.setStyleSheet("""
-            QCheckBox { color: #ff6666; font-weight: bold; }
-            QCheckBox::indicator { width: 22px; height: 22px; }
-            QCheckBox::indicator:checked { background-color: #ff6666; border: 2px solid #ff6666; border-radius: 3px; }
-            QCheckBox::indicator:unchecked { background-color: #3c3c3c; border: 2px solid #ff6666; border-radius: 3px; }
-        """)
+        self.red_checkbox.setObjectName("redCheck")  # Styled by _DARK_THEME
         self.red_checkbox.stateChanged.connect(self.on_channel_checkbox_changed)
         checkbox_layout.addWidget(self.red_checkbox)
         
         self.green_checkbox = QCheckBox("G")
         self.green_checkbox.setChecked(True)
-        self.green_checkbox.setStyleSheet("""
-            QCheckBox { color: #66ff66; font-weight: bold; }
-            QCheckBox::indicator { width: 22px; height: 22px; }
-            QCheckBox::indicator:checked { background-color: #66ff66; border: 2px solid #66ff66; border-radius: 3px; }
-            QCheckBox::indicator:unchecked { background-color: #3c3c3c; border: 2px solid #66ff66; border-radius: 3px; }
-        """)
+        self.green_checkbox.setObjectName("greenCheck")  # Styled by _DARK_THEME
         self.green_checkbox.stateChanged.connect(self.on_channel_checkbox_changed)
         checkbox_layout.addWidget(self.green_checkbox)
         
         self.blue_checkbox = QCheckBox("B")
         self.blue_checkbox.setChecked(True)
-        self.blue_checkbox.setStyleSheet("""
-            QCheckBox { color: #6666ff; font-weight: bold; }
-            QCheckBox::indicator { width: 22px; height: 22px; }
-            QCheckBox::indicator:checked { background-color: #6666ff; border: 2px solid #6666ff; border-radius: 3px; }
-            QCheckBox::indicator:unchecked { background-color: #3c3c3c; border: 2px solid #6666ff; border-radius: 3px; }
-        """)
+        self.blue_checkbox.setObjectName("blueCheck")  # Styled by _DARK_THEME
         self.blue_checkbox.stateChanged.connect(self.on_channel_checkbox_changed)
         checkbox_layout.addWidget(self.blue_checkbox)
         
@@ -484,31 +668,10 @@ class FluoroAnalyzer(QMainWindow):
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts."""
-        shortcuts = {
-            'R': self.toggle_red_channel,
-            'G': self.toggle_green_channel,
-            'B': self.toggle_blue_channel,
-            'M': lambda: self.set_channel_mode(ChannelMode.MAGENTA),
-            'C': lambda: self.set_channel_mode(ChannelMode.CYAN),
-            'Y': lambda: self.set_channel_mode(ChannelMode.YELLOW),
-            'A': lambda: self.set_channel_mode(ChannelMode.COMPOSITE),
-            'Ctrl+O': self.open_file,
-            'Ctrl+Z': self.undo_last_marker,
-            'Ctrl+Shift+Z': self.redo_marker,
-            'Ctrl+S': self.export_all,
-            'Ctrl+Shift+S': self.skip_batch_image,
-            'Escape': self.handle_escape,
-            'Space': self.cycle_active_cell_type,
-            'F': lambda: self.set_tool_mode(ToolMode.CELL_COUNT),
-            'D': lambda: self.set_tool_mode(ToolMode.ROI_DRAW),
-            'E': lambda: self.set_tool_mode(ToolMode.PAN),
-            'V': self.canvas.reset_view,
-            'Shift+D': self.start_new_roi,
-        }
-        
-        for key, callback in shortcuts.items():
+        for key, slot_path, args in _SHORTCUTS:
+            slot = attrgetter(slot_path)(self)
             shortcut = QShortcut(QKeySequence(key), self)
-            shortcut.activated.connect(callback)
+            shortcut.activated.connect(partial(slot, *args) if args else slot)
     
     def handle_escape(self):
         """Handle Escape key - cancel ROI or batch processing."""
@@ -535,8 +698,8 @@ class FluoroAnalyzer(QMainWindow):
     def setup_default_cell_types(self):
         """Setup default cell types."""
         defaults = [
-            CellType("Type 1", QColor(255, 255, 255), MarkerType.CIRCLE, 20),
-            CellType("Type 2", QColor(255, 0, 255), MarkerType.DOT, 10, LabelPosition.TOP),
+            CellType.from_qcolor("Type 1", QColor(255, 255, 255), MarkerType.CIRCLE, 20),
+            CellType.from_qcolor("Type 2", QColor(255, 0, 255), MarkerType.DOT, 10, LabelPosition.TOP),
         ]
         
         for ct in defaults:
@@ -555,6 +718,7 @@ class FluoroAnalyzer(QMainWindow):
         widget.name_change_requested.connect(self.handle_cell_type_rename)
         widget.delete_requested.connect(self.delete_cell_type)
         self.cell_type_layout.addWidget(widget)
+        self.cell_type_widgets[cell_type.name] = widget
     
     def delete_cell_type(self, name: str):
         """Delete a cell type."""
@@ -563,19 +727,17 @@ class FluoroAnalyzer(QMainWindow):
             return
         
         # Remove markers of this type
-        self.cell_markers = [m for m in self.cell_markers if m.cell_type != name]
+        self.cell_markers.remove_type(name)
         
         # Remove from cell_types dict
         if name in self.cell_types:
             del self.cell_types[name]
         
         # Remove widget
-        for i in range(self.cell_type_layout.count()):
-            widget = self.cell_type_layout.itemAt(i).widget()
-            if isinstance(widget, CellTypeWidget) and widget.cell_type.name == name:
-                self.cell_type_layout.removeWidget(widget)
-                widget.deleteLater()
-                break
+        widget = self.cell_type_widgets.pop(name, None)
+        if widget is not None:
+            self.cell_type_layout.removeWidget(widget)
+            widget.deleteLater()
         
         # Remove from combo
         index = self.active_cell_combo.findText(name)
@@ -598,21 +760,20 @@ class FluoroAnalyzer(QMainWindow):
         """Handle cell type rename request."""
         if new_name in self.cell_types:
             QMessageBox.warning(self, "Name Exists", f"A cell type named '{new_name}' already exists.")
-            for i in range(self.cell_type_layout.count()):
-                widget = self.cell_type_layout.itemAt(i).widget()
-                if isinstance(widget, CellTypeWidget) and widget.cell_type.name == old_name:
-                    widget.update_name_display(old_name)
+            widget = self.cell_type_widgets.get(old_name)
+            if widget is not None:
+                widget.update_name_display(old_name)
             return
         
         # Update cell type
         cell_type = self.cell_types.pop(old_name)
         cell_type.name = new_name
         self.cell_types[new_name] = cell_type
+        if old_name in self.cell_type_widgets:
+            self.cell_type_widgets[new_name] = self.cell_type_widgets.pop(old_name)
         
         # Update markers
-        for marker in self.cell_markers:
-            if marker.cell_type == old_name:
-                marker.cell_type = new_name
+        self.cell_markers.rename_type(old_name, new_name)
         
         # Update combo
         index = self.active_cell_combo.findText(old_name)
@@ -627,82 +788,63 @@ class FluoroAnalyzer(QMainWindow):
     
     def apply_dark_theme(self):
         """Apply dark theme to the application."""
-        self.setStyleSheet("""
-            QMainWindow, QWidget { background-color: #2b2b2b; color: #ffffff; }
-            QGroupBox { border: 1px solid #555; border-radius: 5px; margin-top: 10px; padding-top: 10px; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QPushButton { background-color: #3c3c3c; border: 1px solid #555; border-radius: 4px; padding: 5px 10px; }
-            QPushButton:hover { background-color: #4a4a4a; }
-            QPushButton:pressed { background-color: #555555; }
-            QPushButton:checked { background-color: #0078d4; }
-            QComboBox, QLineEdit { background-color: #3c3c3c; border: 1px solid #555; border-radius: 3px; padding: 3px; }
-            QSpinBox, QDoubleSpinBox { 
-                background-color: #3c3c3c; 
-                border: 1px solid #555; 
-                border-radius: 3px; 
-                padding: 3px;
-                padding-right: 20px;
-            }
-            QSpinBox::up-button, QDoubleSpinBox::up-button {
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 20px;
-                height: 12px;
-                border-left: 1px solid #555;
-                border-bottom: 1px solid #555;
-                border-top-right-radius: 3px;
-                background-color: #4a4a4a;
-            }
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover {
-                background-color: #5a5a5a;
-            }
-            QSpinBox::up-button:pressed, QDoubleSpinBox::up-button:pressed {
-                background-color: #666666;
-            }
-            QSpinBox::down-button, QDoubleSpinBox::down-button {
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 20px;
-                height: 12px;
-                border-left: 1px solid #555;
-                border-bottom-right-radius: 3px;
-                background-color: #4a4a4a;
-            }
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
-                background-color: #5a5a5a;
-            }
-            QSpinBox::down-button:pressed, QDoubleSpinBox::down-button:pressed {
-                background-color: #666666;
-            }
-            QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
-                width: 10px;
-                height: 10px;
-            }
-            QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
-                width: 10px;
-                height: 10px;
-            }
-            QListWidget, QTableWidget { background-color: #3c3c3c; border: 1px solid #555; }
-            QScrollArea { border: none; }
-            QToolBar { background-color: #2b2b2b; border: none; spacing: 5px; padding: 5px; }
-            QStatusBar { background-color: #2b2b2b; }
-            QSlider::groove:horizontal { height: 6px; background: #3c3c3c; border-radius: 3px; }
-            QSlider::handle:horizontal { width: 14px; margin: -4px 0; background: #0078d4; border-radius: 7px; }
-        """)
+        self.setStyleSheet(_DARK_THEME)
     
     def show_adjustments_dialog(self):
-        """Show the image adjustments dialog."""
-        if self.adjustments_dialog is None or not self.adjustments_dialog.isVisible():
+        """Show the image adjustments dialog, creating it on first use."""
+        if self.adjustments_dialog is None:
             self.adjustments_dialog = AdjustmentsDialog(self.image_adjustments, self)
             self.adjustments_dialog.adjustments_changed.connect(self.on_adjustments_changed)
-            self.adjustments_dialog.show()
-        else:
-            self.adjustments_dialog.raise_()
-            self.adjustments_dialog.activateWindow()
+            self.adjustments_dialog.slider_drag_changed.connect(self.on_slider_drag_changed)
+        elif not self.adjustments_dialog.isVisible():
+            # Values may have changed while hidden (new image, imported settings)
+            self.adjustments_dialog.load_values()
+        self.adjustments_dialog.show()
+        self.adjustments_dialog.raise_()
+        self.adjustments_dialog.activateWindow()
     
     def on_adjustments_changed(self):
-        """Handle adjustments change."""
-        self.update_display()
+        """Handle adjustments change by recomputing on the worker thread."""
+        if self.image_data is None:
+            return
+        if self._slider_dragging:
+            if self._preview_data is None:
+                self._preview_data = downsample_image(self.image_data, _PREVIEW_FACTOR)
+            source, scale = self._preview_data, _PREVIEW_FACTOR
+            roi = self._visible_region(_PREVIEW_FACTOR)  # Off-screen pixels wait for the release
+        else:
+            source, scale, roi = self.image_data, 1.0, None
+        
+        # Revisited values (e.g. slider jitter) are shown straight from the cache; region
+        # updates are composites of whatever was shown before, so they are never cached
+        pixmap = None
+        if roi is None:
+            pixmap = QPixmapCache.find(self._pixmap_cache_key(source, self.image_adjustments))
+        if pixmap is not None:
+            self.update_display(pixmap=pixmap, scale=scale)
+        else:
+            self._adjust_worker.submit(source, self.image_adjustments, roi)
+    
+    def on_slider_drag_changed(self, dragging: bool):
+        """Switch between the half-resolution preview and the full image."""
+        self._slider_dragging = dragging
+        self.canvas.set_interactive_preview(dragging)
+        if not dragging:
+            self.on_adjustments_changed()  # Final full-resolution update
+    
+    def on_adjusted_image_ready(self, image, adjustments, roi, adjusted_data):
+        """Display an image adjusted by the worker thread."""
+        try:
+            if image is self.image_data:
+                scale = 1.0
+            elif image is self._preview_data and self._slider_dragging:
+                scale = _PREVIEW_FACTOR
+            else:
+                return  # Stale result (new image loaded or drag finished)
+            self.update_display(pixmap=self._adjusted_pixmap(image, adjustments, adjusted_data, roi), scale=scale)
+        finally:
+            # The pixmap holds its own copy, so the worker may reuse the array
+            self._adjust_worker.result_displayed()
     
     def on_channel_checkbox_changed(self):
         """Handle channel checkbox state changes."""
@@ -710,7 +852,8 @@ class FluoroAnalyzer(QMainWindow):
         self.channel_g_enabled = self.green_checkbox.isChecked()
         self.channel_b_enabled = self.blue_checkbox.isChecked()
         self.update_channel_label()
-        self.update_display()
+        if self.image_data is not None:
+            self._channel_timer.start()
     
     def channel_combo_changed(self, index):
         """Handle channel combo change."""
@@ -725,49 +868,19 @@ class FluoroAnalyzer(QMainWindow):
         self.channel_combo.setCurrentText(mode.name.capitalize())
         self.channel_combo.blockSignals(False)
         
-        self.red_checkbox.blockSignals(True)
-        self.green_checkbox.blockSignals(True)
-        self.blue_checkbox.blockSignals(True)
-        
-        if mode == ChannelMode.COMPOSITE:
-            self.red_checkbox.setChecked(True)
-            self.green_checkbox.setChecked(True)
-            self.blue_checkbox.setChecked(True)
-        elif mode == ChannelMode.RED:
-            self.red_checkbox.setChecked(True)
-            self.green_checkbox.setChecked(False)
-            self.blue_checkbox.setChecked(False)
-        elif mode == ChannelMode.GREEN:
-            self.red_checkbox.setChecked(False)
-            self.green_checkbox.setChecked(True)
-            self.blue_checkbox.setChecked(False)
-        elif mode == ChannelMode.BLUE:
-            self.red_checkbox.setChecked(False)
-            self.green_checkbox.setChecked(False)
-            self.blue_checkbox.setChecked(True)
-        elif mode == ChannelMode.CYAN:
-            self.red_checkbox.setChecked(False)
-            self.green_checkbox.setChecked(True)
-            self.blue_checkbox.setChecked(True)
-        elif mode == ChannelMode.MAGENTA:
-            self.red_checkbox.setChecked(True)
-            self.green_checkbox.setChecked(False)
-            self.blue_checkbox.setChecked(True)
-        elif mode == ChannelMode.YELLOW:
-            self.red_checkbox.setChecked(True)
-            self.green_checkbox.setChecked(True)
-            self.blue_checkbox.setChecked(False)
-        
-        self.red_checkbox.blockSignals(False)
-        self.green_checkbox.blockSignals(False)
-        self.blue_checkbox.blockSignals(False)
+        checkboxes = (self.red_checkbox, self.green_checkbox, self.blue_checkbox)
+        for checkbox, checked in zip(checkboxes, _MODE_TO_RGB[mode]):
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
         
         self.channel_r_enabled = self.red_checkbox.isChecked()
         self.channel_g_enabled = self.green_checkbox.isChecked()
         self.channel_b_enabled = self.blue_checkbox.isChecked()
         
         self.update_channel_label()
-        self.update_display()
+        if self.image_data is not None:
+            self._channel_timer.start()
     
     def update_channel_label(self):
         """Update the channel label."""
@@ -829,7 +942,7 @@ class FluoroAnalyzer(QMainWindow):
             
             color = QColorDialog.getColor(QColor(255, 255, 255), self)
             if color.isValid():
-                ct = CellType(name, color, MarkerType.CIRCLE, 20)
+                ct = CellType.from_qcolor(name, color, MarkerType.CIRCLE, 20)
                 self.cell_types[name] = ct
                 self.add_cell_type_widget(ct)
                 self.active_cell_combo.addItem(name)
@@ -862,7 +975,7 @@ class FluoroAnalyzer(QMainWindow):
         """Browse for output directory."""
         dir_path = QFileDialog.getExistingDirectory(
             self, "Select Output Directory",
-            self.output_dir_edit.text() or (str(Path(self.current_file).parent) if self.current_file else "")
+            self.output_dir_edit.text() or (str(self.current_path.parent) if self.current_file else "")
         )
         if dir_path:
             self.output_dir_edit.setText(dir_path)
@@ -881,10 +994,12 @@ class FluoroAnalyzer(QMainWindow):
             self.cell_markers.clear()
             self.undo_stack.clear()
             self.rois.clear()
+            self._roi_geometry = None
             self.current_roi = None
             self.roi_list.clear()
-            self.marker_items.clear()
-            self.roi_items.clear()
+            # Take the old items out of the scene now that the stores are empty
+            self.refresh_markers()
+            self.refresh_rois()
             self.selected_marker_index = -1
             
             # Reset channels to all enabled
@@ -909,7 +1024,7 @@ class FluoroAnalyzer(QMainWindow):
                     self.adjustments_dialog.load_values()
             
             if path.suffix.lower() in ('.tif', '.tiff') and HAS_TIFF:
-                self.image_data = tifffile.imread(file_path)
+                self.image_data = _read_tiff(path)
                 
                 if self.image_data.ndim == 2:
                     self.image_data = np.stack([self.image_data] * 3, axis=-1)
@@ -927,16 +1042,19 @@ class FluoroAnalyzer(QMainWindow):
                 img = Image.open(file_path)
                 if img.mode != 'RGB':
                     img = img.convert('RGB')
-                self.image_data = np.array(img)
+                # Read-only view of Pillow's exported pixel buffer, like a mapped TIFF
+                self.image_data = np.asarray(img)
             
-            if self.image_data.dtype != np.uint8:
-                if self.image_data.max() > 255:
-                    self.image_data = ((self.image_data - self.image_data.min()) / 
-                                      (self.image_data.max() - self.image_data.min()) * 255).astype(np.uint8)
-                else:
-                    self.image_data = self.image_data.astype(np.uint8)
+            self.image_data = to_uint8(self.image_data)
+            
+            # Row-major pixels (e.g. after a TIFF transpose); QImage needs a contiguous buffer
+            self.image_data = np.ascontiguousarray(self.image_data)
             
             self.current_file = file_path
+            self.current_path = path
+            self._preview_data = None
+            clear_adjustment_cache()
+            QPixmapCache.clear()
             self.update_display(reset_view=True)
             self.update_image_info()
             self.update_results_table()
@@ -975,53 +1093,113 @@ class FluoroAnalyzer(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load image:\n{str(e)}")
     
-    def update_display(self, reset_view: bool = False):
-        """Update the image display."""
-        if self.image_data is None:
-            return
+    def _visible_region(self, factor: int = 1) -> tuple:
+        """Return the visible part of the image as (x0, y0, x1, y1) in pixels of an image downsampled by factor."""
+        rect = self.canvas.mapToScene(self.canvas.viewport().rect()).boundingRect()
+        return (
+            int(np.floor(rect.left() / factor)), int(np.floor(rect.top() / factor)),
+            int(np.ceil(rect.right() / factor)), int(np.ceil(rect.bottom() / factor))
+        )
+    
+    def _pixmap_cache_key(self, source: np.ndarray, adjustments: ImageAdjustments) -> str:
+        """Return the QPixmapCache key for a source image under the given display state."""
+        channels = f"{int(self.channel_r_enabled)}{int(self.channel_g_enabled)}{int(self.channel_b_enabled)}"
+        return f"fluoro:{id(source)}:{adjustments.as_tuple()}:{channels}"
+    
+    def _adjusted_pixmap(self, source: np.ndarray, adjustments: ImageAdjustments,
+                         adjusted_data: Optional[np.ndarray] = None,
+                         roi: Optional[tuple] = None) -> QPixmap:
+        """
+        Return the display pixmap for a source image, using QPixmapCache.
+        
+        Args:
+            source: Image the adjustments are applied to (full or preview)
+            adjustments: Adjustment values to apply
+            adjusted_data: Already adjusted image data (computed here if None)
+            roi: Region the adjustments were limited to, if any. Such
+                composites keep the previous pixels outside the region, so
+                they are not cached.
+        """
+        key = self._pixmap_cache_key(source, adjustments) if roi is None else None
+        pixmap = QPixmapCache.find(key) if key is not None else None
+        if pixmap is not None:
+            return pixmap
         
         # Apply image adjustments
-        adjusted_data = apply_all_adjustments(self.image_data, self.image_adjustments)
+        if adjusted_data is None:
+            adjusted_data = apply_all_adjustments(source, adjustments, roi)
         
         # Apply channel mode
         display_data = self.apply_channel_mode(adjusted_data)
         
-        # Convert to QImage
-        height, width = display_data.shape[:2]
-        if display_data.ndim == 3 and display_data.shape[2] == 3:
-            bytes_per_line = 3 * width
-            qimage = QImage(display_data.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-        else:
-            bytes_per_line = width
-            qimage = QImage(display_data.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale8)
+        # Wrap the array without copying; fromImage then makes the pixmap's copy
+        qimage = self._ndarray_to_qimage(display_data)
         
         pixmap = QPixmap.fromImage(qimage)
+        self._display_backing = None  # The pixmap holds its own copy now
+        if key is not None:
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def _ndarray_to_qimage(self, arr: np.ndarray) -> QImage:
+        """
+        Wrap a uint8 RGB or grayscale array in a QImage without copying.
+        
+        The QImage reads the array's memory directly. The array is kept on
+        self._display_backing so it stays alive while the QImage is in use;
+        clear that once the QImage has been converted, and do not modify the
+        array before then.
+        """
+        arr = np.ascontiguousarray(arr)  # No-op for the usual contiguous data
+        self._display_backing = arr
+        height, width = arr.shape[:2]
+        if arr.ndim == 3 and arr.shape[2] == 3:
+            return QImage(arr.data, width, height, arr.strides[0], QImage.Format.Format_RGB888)
+        return QImage(arr.data, width, height, arr.strides[0], QImage.Format.Format_Grayscale8)
+    
+    def update_display(self, reset_view: bool = False, pixmap: Optional[QPixmap] = None,
+                       scale: float = 1.0):
+        """Update the image display.
+        
+        Args:
+            reset_view: Fit the view to the image after updating
+            pixmap: Already rendered display pixmap (rendered here if None)
+            scale: Scene size of one pixmap pixel (for downsampled previews)
+        """
+        if self.image_data is None:
+            return
         
-        self.marker_items.clear()
-        self.roi_items.clear()
+        if pixmap is None:
+            pixmap = self._adjusted_pixmap(self.image_data, self.image_adjustments)
         
         if reset_view:
             self.canvas.set_image(pixmap)
+            rebuilt = True
         else:
-            self.canvas.update_pixmap(pixmap)
+            rebuilt = self.canvas.update_pixmap(pixmap, scale)
         
-        self.refresh_markers()
-        self.refresh_rois()
+        if rebuilt:
+            # The scene was cleared, taking the overlay items with it
+            self.marker_items.clear()
+            self.roi_items.clear()
+            self.roi_item_groups.clear()
+            self.refresh_markers()
+            self.refresh_rois()
     
     def apply_channel_mode(self, data: np.ndarray) -> np.ndarray:
         """Apply channel mode to image data."""
         if data.ndim != 3 or data.shape[2] < 3:
             return data
         
-        r, g, b = data[:, :, 0], data[:, :, 1], data[:, :, 2]
-        result = np.zeros_like(data)
+        enabled = (self.channel_r_enabled, self.channel_g_enabled, self.channel_b_enabled)
+        if all(enabled):
+            return data  # Composite: nothing to mask
         
-        if self.channel_r_enabled:
-            result[:, :, 0] = r
-        if self.channel_g_enabled:
-            result[:, :, 1] = g
-        if self.channel_b_enabled:
-            result[:, :, 2] = b
+        # One contiguous copy, then zero only the disabled planes
+        result = data.copy()
+        for channel, keep in enumerate(enabled):
+            if not keep:
+                result[:, :, channel] = 0
         
         return result
     
@@ -1032,7 +1210,7 @@ class FluoroAnalyzer(QMainWindow):
             channels = self.image_data.shape[2] if self.image_data.ndim == 3 else 1
             dtype = self.image_data.dtype
             self.info_label.setText(f"Size: {w} x {h}\nChannels: {channels}\nType: {dtype}")
-            self.file_label.setText(Path(self.current_file).name if self.current_file else "Unknown")
+            self.file_label.setText(self.current_path.name if self.current_file else "Unknown")
         else:
             self.info_label.setText("No image loaded")
             self.file_label.setText("No file loaded")
@@ -1045,139 +1223,153 @@ class FluoroAnalyzer(QMainWindow):
         
         self.undo_stack.clear()
         
-        roi_name = None
-        for roi in self.rois:
-            if roi.closed:
-                polygon = QPolygonF([QPointF(*p) for p in roi.points])
-                if polygon.containsPoint(pos, Qt.FillRule.OddEvenFill):
-                    roi_name = roi.name
-                    break
+        roi_idx = self.find_roi_at(pos)
+        roi_name = self.rois[roi_idx].name if roi_idx >= 0 else None
         
-        type_markers = [m for m in self.cell_markers if m.cell_type == self.current_cell_type]
-        marker_number = len(type_markers) + 1
+        marker_number = self.cell_markers.count_of_type(self.current_cell_type) + 1
+        self.cell_markers.append(pos.x(), pos.y(), self.current_cell_type, marker_number, roi_name)
         
-        marker = CellMarker(pos, self.current_cell_type, marker_number, roi_name)
-        self.cell_markers.append(marker)
-        
-        self.refresh_markers()
+        self._append_marker_items()
         self.update_results_table()
         self.status_bar.showMessage(f"Added {self.current_cell_type} marker #{marker_number}")
     
     def refresh_markers(self):
-        """Refresh all marker displays."""
-        for item in self.marker_items:
-            try:
-                if item.scene() is not None:
-                    self.canvas.scene.removeItem(item)
-            except RuntimeError:
-                pass
+        """Rebuild all marker items, e.g. after cell type styles change."""
+        for group in self.marker_items:
+            for item in group or ():
+                try:
+                    if item.scene() is not None:
+                        self.canvas.scene.removeItem(item)
+                except RuntimeError:
+                    pass
         self.marker_items.clear()
+        self._marker_styles.clear()
+        
+        type_names = self.cell_markers.type_names
+        markers = zip(
+            self.cell_markers.positions.tolist(),
+            self.cell_markers.type_idx.tolist(),
+            self.cell_markers.number.tolist()
+        )
+        for idx, ((x, y), type_idx, marker_number) in enumerate(markers):
+            self.marker_items.append(self._create_marker_items(idx, x, y, type_names[type_idx], marker_number))
+        
+        self.update_cell_type_counts()
+    
+    def _append_marker_items(self):
+        """Add the items for the newest marker (after appending it to cell_markers)."""
+        idx = len(self.cell_markers) - 1
+        x, y = self.cell_markers.positions[idx].tolist()
+        cell_type = self.cell_markers.type_names[self.cell_markers.type_idx[idx]]
+        self.marker_items.append(self._create_marker_items(idx, x, y, cell_type, int(self.cell_markers.number[idx])))
+        self.update_cell_type_counts()
+    
+    def _remove_marker_items(self, idx: int):
+        """Remove the items of marker idx (after removing it from cell_markers)."""
+        for item in self.marker_items.pop(idx) or ():
+            self.canvas.scene.removeItem(item)
+        self.update_cell_type_counts()
+    
+    def _create_marker_items(self, idx: int, x: float, y: float, type_name: str,
+                             marker_number: int) -> Optional[tuple]:
+        """Add the shape and label items for one marker to the scene and return them."""
+        cell_type = self.cell_types.get(type_name)
+        if cell_type is None:
+            return None
         
-        type_counts = {name: 0 for name in self.cell_types}
+        size = cell_type.marker_size
         
-        for idx, marker in enumerate(self.cell_markers):
-            if marker.cell_type not in self.cell_types:
+        # Highlight selected marker
+        pen, brush, font = self._marker_style(cell_type, idx == self.selected_marker_index)
+        
+        if cell_type.marker_type == MarkerType.DOT:
+            # DOT uses size for diameter
+            dot_size = max(3, size)
+            item = QGraphicsEllipseItem(x - dot_size/2, y - dot_size/2, dot_size, dot_size)
+        elif cell_type.marker_type == MarkerType.CIRCLE:
+            item = QGraphicsEllipseItem(x - size/2, y - size/2, size, size)
+        else:
+            item = QGraphicsRectItem(x - size/2, y - size/2, size, size)
+        item.setPen(pen)
+        item.setBrush(brush)
+        self.canvas.scene.addItem(item)
+        
+        text_item = QGraphicsTextItem(str(marker_number))
+        text_item.setDefaultTextColor(cell_type.color)
+        text_item.setFont(font)
+        self._place_marker_label(text_item, x, y, cell_type)
+        self.canvas.scene.addItem(text_item)
+        return item, text_item
+    
+    def _place_marker_label(self, text_item: QGraphicsTextItem, x: float, y: float, cell_type: CellType):
+        """Position a marker's number label around (x, y) per the cell type's label setting."""
+        size = cell_type.marker_size
+        offset = cell_type.label_offset
+        
+        # Get text bounds for positioning
+        text_bounds = text_item.boundingRect()
+        tw, th = text_bounds.width(), text_bounds.height()
+        
+        (sx, wx, ox), (sy, hy, oy) = _LABEL_ANCHORS.get(cell_type.label_position, _LABEL_ANCHORS[LabelPosition.RIGHT])
+        text_item.setPos(x + sx*size + wx*tw + ox*offset, y + sy*size + hy*th + oy*offset)
+    
+    def _apply_selection_style(self, idx: int):
+        """Restyle marker idx for its current selection state."""
+        if not 0 <= idx < len(self.marker_items) or self.marker_items[idx] is None:
+            return
+        cell_type = self.cell_types[self.cell_markers.type_names[self.cell_markers.type_idx[idx]]]
+        pen, brush, _ = self._marker_style(cell_type, idx == self.selected_marker_index)
+        item = self.marker_items[idx][0]
+        item.setPen(pen)
+        item.setBrush(brush)
+    
+    def _relabel_markers(self, indices):
+        """Update the number labels of the given markers after renumbering."""
+        positions = self.cell_markers.positions
+        for idx in indices:
+            group = self.marker_items[idx]
+            if group is None:
                 continue
-            
-            cell_type = self.cell_types[marker.cell_type]
-            type_counts[marker.cell_type] += 1
-            
-            pos = marker.position
-            size = cell_type.marker_size
-            color = cell_type.color
-            offset = cell_type.label_offset
-            
-            # Highlight selected marker
-            is_selected = (idx == self.selected_marker_index)
-            
-            pen = QPen(color)
+            text_item = group[1]
+            cell_type = self.cell_types[self.cell_markers.type_names[self.cell_markers.type_idx[idx]]]
+            text_item.setPlainText(str(self.cell_markers.number[idx]))
+            x, y = positions[idx].tolist()
+            self._place_marker_label(text_item, x, y, cell_type)  # Width may have changed
+    
+    def update_cell_type_counts(self):
+        """Show the number of markers of each type on its cell type widget."""
+        type_counts = self.cell_markers.counts_by_type()
+        for name, widget in self.cell_type_widgets.items():
+            widget.update_count(type_counts.get(name, 0))
+    
+    def _marker_style(self, cell_type: CellType, is_selected: bool) -> tuple:
+        """Return the (pen, brush, label font) for markers of a cell type, shared until the next full refresh."""
+        style = self._marker_styles.get((cell_type.name, is_selected))
+        if style is not None:
+            return style
+        color = cell_type.color
+        pen = QPen(color)
+        if cell_type.marker_type == MarkerType.DOT:
+            # DOT is filled solid, with a pen width scaled to its size
+            pen_width = max(1, cell_type.marker_size // 6)
+            pen.setWidth(pen_width + 1 if is_selected else pen_width)
+            brush = QBrush(color)
+        else:
             pen.setWidth(3 if is_selected else 2)
-            if is_selected:
-                pen.setStyle(Qt.PenStyle.DashLine)
-            brush = QBrush(QColor(color.red(), color.green(), color.blue(), 80 if is_selected else 50))
-            
-            if cell_type.marker_type == MarkerType.DOT:
-                # DOT uses size for diameter, with scaled pen width
-                dot_size = max(3, size)
-                pen_width = max(1, size // 6)
-                pen.setWidth(pen_width + 1 if is_selected else pen_width)
-                item = QGraphicsEllipseItem(
-                    pos.x() - dot_size/2, pos.y() - dot_size/2, dot_size, dot_size
-                )
-                item.setPen(pen)
-                item.setBrush(QBrush(color))
-            elif cell_type.marker_type == MarkerType.CIRCLE:
-                item = QGraphicsEllipseItem(
-                    pos.x() - size/2, pos.y() - size/2, size, size
-                )
-                item.setPen(pen)
-                item.setBrush(brush)
-            else:
-                from PyQt6.QtWidgets import QGraphicsRectItem
-                item = QGraphicsRectItem(
-                    pos.x() - size/2, pos.y() - size/2, size, size
-                )
-                item.setPen(pen)
-                item.setBrush(brush)
-            
-            self.canvas.scene.addItem(item)
-            self.marker_items.append(item)
-            
-            # Calculate label position based on cell type setting
-            font = QFont("Arial", cell_type.label_size, QFont.Weight.Bold)
-            text_item = QGraphicsTextItem(str(marker.marker_number))
-            text_item.setDefaultTextColor(color)
-            text_item.setFont(font)
-            
-            # Get text bounds for positioning
-            text_bounds = text_item.boundingRect()
-            tw, th = text_bounds.width(), text_bounds.height()
-            
-            label_pos = cell_type.label_position
-            if label_pos == LabelPosition.RIGHT:
-                text_x = pos.x() + size/2 + offset
-                text_y = pos.y() - th/2
-            elif label_pos == LabelPosition.LEFT:
-                text_x = pos.x() - size/2 - tw - offset
-                text_y = pos.y() - th/2
-            elif label_pos == LabelPosition.TOP:
-                text_x = pos.x() - tw/2
-                text_y = pos.y() - size/2 - th - offset
-            elif label_pos == LabelPosition.BOTTOM:
-                text_x = pos.x() - tw/2
-                text_y = pos.y() + size/2 + offset
-            elif label_pos == LabelPosition.TOP_RIGHT:
-                text_x = pos.x() + size/2 + offset
-                text_y = pos.y() - size/2 - th
-            elif label_pos == LabelPosition.TOP_LEFT:
-                text_x = pos.x() - size/2 - tw - offset
-                text_y = pos.y() - size/2 - th
-            elif label_pos == LabelPosition.BOTTOM_RIGHT:
-                text_x = pos.x() + size/2 + offset
-                text_y = pos.y() + size/2
-            elif label_pos == LabelPosition.BOTTOM_LEFT:
-                text_x = pos.x() - size/2 - tw - offset
-                text_y = pos.y() + size/2
-            else:
-                text_x = pos.x() + size/2 + offset
-                text_y = pos.y() - th/2
-            
-            text_item.setPos(text_x, text_y)
-            self.canvas.scene.addItem(text_item)
-            self.marker_items.append(text_item)
-        
-        for i in range(self.cell_type_layout.count()):
-            widget = self.cell_type_layout.itemAt(i).widget()
-            if isinstance(widget, CellTypeWidget):
-                count = type_counts.get(widget.cell_type.name, 0)
-                widget.update_count(count)
+            fill_alpha = 80 if is_selected else 50
+            brush = QBrush(QColor.fromRgba((cell_type.color_argb & 0x00FFFFFF) | (fill_alpha << 24)))
+        if is_selected:
+            pen.setStyle(Qt.PenStyle.DashLine)
+        style = pen, brush, QFont("Arial", cell_type.label_size, QFont.Weight.Bold)
+        self._marker_styles[cell_type.name, is_selected] = style
+        return style
     
     def undo_last_marker(self):
         """Remove the last added marker."""
         if self.cell_markers:
             marker = self.cell_markers.pop()
             self.undo_stack.append(marker)
-            self.refresh_markers()
+            self._remove_marker_items(len(self.cell_markers))
             self.update_results_table()
             self.status_bar.showMessage(f"Removed {marker.cell_type} marker #{marker.marker_number}")
     
@@ -1185,47 +1377,40 @@ class FluoroAnalyzer(QMainWindow):
         """Redo the last undone marker."""
         if self.undo_stack:
             marker = self.undo_stack.pop()
-            self.cell_markers.append(marker)
-            self.refresh_markers()
+            self.cell_markers.push(marker)
+            self._append_marker_items()
             self.update_results_table()
             self.status_bar.showMessage(f"Restored {marker.cell_type} marker #{marker.marker_number}")
     
     def find_marker_at(self, pos: QPointF) -> int:
         """Find marker at position."""
         threshold = 15
-        for idx, marker in enumerate(self.cell_markers):
-            dist = ((pos.x() - marker.position.x()) ** 2 + 
-                    (pos.y() - marker.position.y()) ** 2) ** 0.5
-            if dist < threshold:
-                return idx
-        return -1
+        return self.cell_markers.find_near(pos.x(), pos.y(), threshold)
     
     def move_marker(self, marker_idx: int, new_pos: QPointF):
         """Move a marker."""
         if 0 <= marker_idx < len(self.cell_markers):
-            marker = self.cell_markers[marker_idx]
-            marker.position = new_pos
+            old_x, old_y = self.cell_markers.positions[marker_idx].tolist()
+            self.cell_markers.set_position(marker_idx, new_pos.x(), new_pos.y())
             
-            marker.roi_name = None
-            for roi in self.rois:
-                if roi.closed:
-                    polygon = QPolygonF([QPointF(*p) for p in roi.points])
-                    if polygon.containsPoint(new_pos, Qt.FillRule.OddEvenFill):
-                        marker.roi_name = roi.name
-                        break
+            roi_idx = self.find_roi_at(new_pos)
+            self.cell_markers.roi_names[marker_idx] = self.rois[roi_idx].name if roi_idx >= 0 else None
             
-            self.refresh_markers()
+            # Shift the marker's own items so only their old and new bounds repaint
+            for item in self.marker_items[marker_idx] or ():
+                item.moveBy(new_pos.x() - old_x, new_pos.y() - old_y)
             self.update_results_table()
     
     def select_marker(self, marker_idx: int):
         """Select a marker for potential deletion."""
-        self.selected_marker_index = marker_idx
+        previous, self.selected_marker_index = self.selected_marker_index, marker_idx
         if marker_idx >= 0:
-            marker = self.cell_markers[marker_idx]
+            marker = self.cell_markers.marker(marker_idx)
             self.status_bar.showMessage(
                 f"Selected {marker.cell_type} marker #{marker.marker_number} - Press Delete or Backspace to remove"
             )
-        self.refresh_markers()
+        self._apply_selection_style(previous)
+        self._apply_selection_style(marker_idx)
     
     def delete_selected_marker(self):
         """Delete the currently selected marker."""
@@ -1233,16 +1418,14 @@ class FluoroAnalyzer(QMainWindow):
             marker = self.cell_markers.pop(self.selected_marker_index)
             self.undo_stack.append(marker)
             self.status_bar.showMessage(f"Deleted {marker.cell_type} marker #{marker.marker_number}")
+            self._remove_marker_items(self.selected_marker_index)
             self.selected_marker_index = -1
             
-            # Renumber remaining markers of the same type
-            type_num = 1
-            for m in self.cell_markers:
-                if m.cell_type == marker.cell_type:
-                    m.marker_number = type_num
-                    type_num += 1
+            # Renumber remaining markers of the same type, relabelling only those that changed
+            numbers = self.cell_markers.number.copy()
+            self.cell_markers.renumber_type(marker.cell_type)
+            self._relabel_markers(np.flatnonzero(self.cell_markers.number != numbers).tolist())
             
-            self.refresh_markers()
             self.update_results_table()
     
     def keyPressEvent(self, event):
@@ -1323,7 +1506,7 @@ class FluoroAnalyzer(QMainWindow):
         color = QColor(color_str)
         line_width = self.roi_width_spin.value()
         
-        self.current_roi = ROI(name, color=color, line_width=line_width)
+        self.current_roi = ROI(name, color_argb=color.rgba(), line_width=line_width)
         self.rois.append(self.current_roi)
         self.set_tool_mode(ToolMode.ROI_DRAW)
         self.canvas.last_roi_point = None
@@ -1332,15 +1515,16 @@ class FluoroAnalyzer(QMainWindow):
     def add_roi_point(self, pos: QPointF):
         """Add a point to the current ROI."""
         if self.current_roi:
-            self.current_roi.points.append((pos.x(), pos.y()))
+            self.current_roi.append_point(pos.x(), pos.y())
             self.canvas.set_last_roi_point(pos)
             self.refresh_rois()
-            self.status_bar.showMessage(f"ROI: {self.current_roi.name} - {len(self.current_roi.points)} points")
+            self.status_bar.showMessage(f"ROI: {self.current_roi.name} - {self.current_roi.num_points} points")
     
     def close_current_roi(self):
         """Close the current ROI."""
-        if self.current_roi and len(self.current_roi.points) >= 3:
+        if self.current_roi and self.current_roi.num_points >= 3:
             self.current_roi.closed = True
+            self._roi_geometry = None
             self.roi_list.addItem(self.current_roi.name)
             self.current_roi = None
             self.canvas.clear_temp_line()
@@ -1361,6 +1545,7 @@ class FluoroAnalyzer(QMainWindow):
         """Cancel the current ROI."""
         if self.current_roi:
             self.rois.remove(self.current_roi)
+            self._roi_geometry = None
             self.current_roi = None
             self.canvas.clear_temp_line()
             self.canvas.last_roi_point = None
@@ -1377,141 +1562,218 @@ class FluoroAnalyzer(QMainWindow):
             except RuntimeError:
                 pass
         self.roi_items.clear()
+        self.roi_item_groups.clear()
         
-        for roi in self.rois:
-            if not roi.points:
-                continue
-            
-            pen = QPen(roi.color)
-            pen.setWidth(roi.line_width)
-            
-            num_points = len(roi.points)
-            if num_points >= 2:
-                for i in range(num_points - 1):
-                    p1 = roi.points[i]
-                    p2 = roi.points[i + 1]
-                    line = self.canvas.scene.addLine(p1[0], p1[1], p2[0], p2[1], pen)
-                    self.roi_items.append(line)
-                
-                if roi.closed and num_points >= 3:
-                    p1 = roi.points[-1]
-                    p2 = roi.points[0]
-                    line = self.canvas.scene.addLine(p1[0], p1[1], p2[0], p2[1], pen)
-                    self.roi_items.append(line)
-            
-            vertex_size = 10
-            for px, py in roi.points:
-                vertex = QGraphicsEllipseItem(
-                    px - vertex_size/2, py - vertex_size/2, vertex_size, vertex_size
-                )
-                vertex.setPen(pen)
-                vertex.setBrush(QBrush(roi.color))
-                self.canvas.scene.addItem(vertex)
-                self.roi_items.append(vertex)
-            
-            if roi.points:
-                first_point = roi.points[0]
-                text = QGraphicsTextItem(roi.name)
-                text.setDefaultTextColor(roi.color)
-                text.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-                text.setPos(first_point[0], first_point[1] - 20)
-                self.canvas.scene.addItem(text)
-                self.roi_items.append(text)
+        for roi_idx, roi in enumerate(self.rois):
+            items = self._add_roi_items(roi)
+            self.roi_items.extend(items)
+            self.roi_item_groups[roi_idx] = items
+    
+    def _add_roi_items(self, roi: ROI) -> list:
+        """Add the line, vertex and label items for one ROI to the scene and return them."""
+        items = []
+        points = roi.points
+        if not points:
+            return items
+        
+        pen = QPen(roi.color)
+        pen.setWidth(roi.line_width)
+        brush = QBrush(roi.color)
+        
+        # One path item for the outline and one for all vertex handles, rather
+        # than an item per segment and per vertex
+        outline, handles = self._roi_paths(roi)
+        if outline is not None:
+            items.append(self.canvas.scene.addPath(outline, pen))
+        items.append(self.canvas.scene.addPath(handles, pen, brush))
+        
+        first_point = points[0]
+        text = QGraphicsTextItem(roi.name)
+        text.setDefaultTextColor(roi.color)
+        text.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        text.setPos(first_point[0], first_point[1] - 20)
+        self.canvas.scene.addItem(text)
+        items.append(text)
+        return items
+    
+    @staticmethod
+    def _roi_paths(roi: ROI) -> tuple:
+        """Return (outline path or None for a single point, vertex handle path) for an ROI."""
+        points = roi.points
+        outline = None
+        if len(points) >= 2:
+            outline = QPainterPath()
+            outline.addPolygon(roi.polygon())
+            if roi.closed and len(points) >= 3:
+                outline.closeSubpath()
+        
+        vertex_size = 10
+        handles = QPainterPath()
+        handles.setFillRule(Qt.FillRule.WindingFill)  # Overlapping handles stay filled
+        for px, py in points:
+            handles.addEllipse(px - vertex_size/2, py - vertex_size/2, vertex_size, vertex_size)
+        return outline, handles
+    
+    def _roi_hit_geometry(self) -> tuple:
+        """
+        Return cached hit-test geometry for the closed ROIs, rebuilding it if stale.
+        
+        Returns:
+            Tuple of (ROI indices, polygons, (M, 4) bounding boxes as
+            x_min, y_min, x_max, y_max, (V, 2) vertices of all closed ROIs,
+            owning ROI index per vertex, vertex index within its ROI)
+        """
+        if self._roi_geometry is None:
+            indices, polygons, bounds = [], [], []
+            vertices, owners, numbers = [], [], []
+            for roi_idx, roi in enumerate(self.rois):
+                if not roi.closed or not roi.num_points:
+                    continue
+                points = roi.vertices
+                indices.append(roi_idx)
+                polygons.append(roi.polygon())
+                bounds.append((*points.min(axis=0), *points.max(axis=0)))
+                vertices.append(points)
+                owners.append(np.full(len(points), roi_idx))
+                numbers.append(np.arange(len(points)))
+            self._roi_geometry = (
+                indices,
+                polygons,
+                np.array(bounds, dtype=np.float64).reshape(-1, 4),
+                np.concatenate(vertices) if vertices else np.empty((0, 2)),
+                np.concatenate(owners) if owners else np.empty(0, dtype=int),
+                np.concatenate(numbers) if numbers else np.empty(0, dtype=int),
+            )
+        return self._roi_geometry
     
     def find_roi_vertex_at(self, pos: QPointF) -> tuple:
         """Find ROI vertex at position."""
         threshold = 15
-        for roi_idx, roi in enumerate(self.rois):
-            if roi.closed:
-                for vertex_idx, (px, py) in enumerate(roi.points):
-                    dist = ((pos.x() - px) ** 2 + (pos.y() - py) ** 2) ** 0.5
-                    if dist < threshold:
-                        return (roi_idx, vertex_idx)
+        _, _, _, vertices, owners, numbers = self._roi_hit_geometry()
+        dx = vertices[:, 0] - pos.x()
+        dy = vertices[:, 1] - pos.y()
+        hits = np.flatnonzero(dx * dx + dy * dy < threshold * threshold)
+        if len(hits):
+            return (int(owners[hits[0]]), int(numbers[hits[0]]))
         return (-1, -1)
     
     def find_roi_at(self, pos: QPointF) -> int:
         """Find ROI containing position."""
-        for idx, roi in enumerate(self.rois):
-            if roi.closed:
-                polygon = QPolygonF([QPointF(*p) for p in roi.points])
-                if polygon.containsPoint(pos, Qt.FillRule.OddEvenFill):
-                    return idx
+        indices, polygons, bounds, _, _, _ = self._roi_hit_geometry()
+        x, y = pos.x(), pos.y()
+        # Cheap bounding-box test first, exact polygon test only on the survivors
+        candidates = np.flatnonzero(
+            (bounds[:, 0] <= x) & (x <= bounds[:, 2]) & (bounds[:, 1] <= y) & (y <= bounds[:, 3])
+        )
+        for k in candidates:
+            if polygons[k].containsPoint(pos, Qt.FillRule.OddEvenFill):
+                return indices[k]
         return -1
     
     def move_roi_vertex(self, roi_idx: int, vertex_idx: int, new_pos: QPointF):
         """Move an ROI vertex."""
         if 0 <= roi_idx < len(self.rois):
             roi = self.rois[roi_idx]
-            if 0 <= vertex_idx < len(roi.points):
-                roi.points[vertex_idx] = (new_pos.x(), new_pos.y())
-                self.refresh_rois()
+            if 0 <= vertex_idx < roi.num_points:
+                roi.set_vertex(vertex_idx, new_pos.x(), new_pos.y())
+                self._roi_geometry = None
+                self._update_roi_paths(roi_idx)
     
     def move_roi(self, roi_idx: int, delta: QPointF):
         """Move an entire ROI."""
         if 0 <= roi_idx < len(self.rois):
             roi = self.rois[roi_idx]
-            roi.points = [(px + delta.x(), py + delta.y()) for px, py in roi.points]
+            roi.translate(delta.x(), delta.y())
+            self._roi_geometry = None
+            group = self.roi_item_groups.get(roi_idx)
+            if group is not None:
+                for item in group:
+                    item.moveBy(delta.x(), delta.y())
+            else:
+                self.refresh_rois()
+    
+    def _update_roi_paths(self, roi_idx: int):
+        """Reshape one ROI's existing outline, handles and label in place after its vertices change."""
+        group = self.roi_item_groups.get(roi_idx)
+        roi = self.rois[roi_idx]
+        outline, handles = self._roi_paths(roi)
+        if group is None or len(group) != (3 if outline is not None else 2):
+            self._rebuild_roi_items(roi_idx)
+            return
+        # Paths are in scene coordinates, so drop any offset left by move_roi
+        for item, path in zip(group, (outline, handles) if outline is not None else (handles,)):
+            item.setPos(0, 0)
+            item.setPath(path)
+        x, y = roi.vertices[0].tolist()
+        group[-1].setPos(x, y - 20)
+    
+    def _rebuild_roi_items(self, roi_idx: int):
+        """Recreate the scene items of one ROI, leaving the other ROIs untouched."""
+        group = self.roi_item_groups.get(roi_idx)
+        if group is None:
             self.refresh_rois()
+            return
+        stale = set(group)
+        for item in group:
+            self.canvas.scene.removeItem(item)
+        self.roi_items = [item for item in self.roi_items if item not in stale]
+        items = self._add_roi_items(self.rois[roi_idx])
+        self.roi_items.extend(items)
+        self.roi_item_groups[roi_idx] = items
+    
+    def _find_roi_index(self, name: str) -> int:
+        """Return the index of the first ROI with this name, or -1."""
+        return next((i for i, roi in enumerate(self.rois) if roi.name == name), -1)
     
     def rename_roi(self, item: QListWidgetItem):
         """Rename an ROI."""
         old_name = item.text()
         new_name, ok = QInputDialog.getText(self, "Rename ROI", "Enter new name:", text=old_name)
         if ok and new_name and new_name != old_name:
-            for roi in self.rois:
-                if roi.name == old_name:
-                    roi.name = new_name
-                    item.setText(new_name)
-                    for marker in self.cell_markers:
-                        if marker.roi_name == old_name:
-                            marker.roi_name = new_name
-                    self.refresh_rois()
-                    self.update_results_table()
-                    break
+            roi_idx = self._find_roi_index(old_name)
+            if roi_idx >= 0:
+                self.rois[roi_idx].name = new_name
+                item.setText(new_name)
+                self.cell_markers.rename_roi(old_name, new_name)
+                self._rebuild_roi_items(roi_idx)
+                self.update_results_table()
     
     def on_roi_selected(self, item: QListWidgetItem):
         """Handle ROI selection."""
-        for roi in self.rois:
-            if roi.name == item.text():
-                self.roi_color_btn.setStyleSheet(
-                    f"background-color: {roi.color.name()}; border: 1px solid #555; border-radius: 3px;"
-                )
-                self.roi_width_spin.blockSignals(True)
-                self.roi_width_spin.setValue(roi.line_width)
-                self.roi_width_spin.blockSignals(False)
-                break
+        roi_idx = self._find_roi_index(item.text())
+        if roi_idx >= 0:
+            roi = self.rois[roi_idx]
+            self.roi_color_btn.setStyleSheet(
+                f"background-color: {roi.color.name()}; border: 1px solid #555; border-radius: 3px;"
+            )
+            self.roi_width_spin.blockSignals(True)
+            self.roi_width_spin.setValue(roi.line_width)
+            self.roi_width_spin.blockSignals(False)
     
     def change_roi_color(self):
         """Change ROI color."""
         current_color = QColor(255, 255, 0)
         current_item = self.roi_list.currentItem()
-        if current_item:
-            for roi in self.rois:
-                if roi.name == current_item.text():
-                    current_color = roi.color
-                    break
+        roi_idx = self._find_roi_index(current_item.text()) if current_item else -1
+        if roi_idx >= 0:
+            current_color = self.rois[roi_idx].color
         
         color = QColorDialog.getColor(current_color, self, "Select ROI Color")
         if color.isValid():
             self.roi_color_btn.setStyleSheet(
                 f"background-color: {color.name()}; border: 1px solid #555; border-radius: 3px;"
             )
-            if current_item:
-                for roi in self.rois:
-                    if roi.name == current_item.text():
-                        roi.color = color
-                        self.refresh_rois()
-                        break
+            if roi_idx >= 0:
+                self.rois[roi_idx].color = color
+                self._rebuild_roi_items(roi_idx)
     
     def change_roi_width(self, width: int):
         """Change ROI width."""
         current_item = self.roi_list.currentItem()
-        if current_item:
-            for roi in self.rois:
-                if roi.name == current_item.text():
-                    roi.line_width = width
-                    self.refresh_rois()
-                    break
+        roi_idx = self._find_roi_index(current_item.text()) if current_item else -1
+        if roi_idx >= 0:
+            self.rois[roi_idx].line_width = width
+            self._rebuild_roi_items(roi_idx)
     
     def roi_context_menu(self, pos):
         """Show ROI context menu."""
@@ -1535,28 +1797,25 @@ class FluoroAnalyzer(QMainWindow):
     
     def delete_roi(self, name: str):
         """Delete an ROI by name."""
-        for roi in self.rois[:]:
-            if roi.name == name:
-                self.rois.remove(roi)
-                for i in range(self.roi_list.count()):
-                    if self.roi_list.item(i).text() == name:
-                        self.roi_list.takeItem(i)
-                        break
-                for marker in self.cell_markers:
-                    if marker.roi_name == name:
-                        marker.roi_name = None
-                self.refresh_rois()
-                self.update_results_table()
-                break
+        roi_idx = self._find_roi_index(name)
+        if roi_idx >= 0:
+            del self.rois[roi_idx]
+            self._roi_geometry = None
+            for i in range(self.roi_list.count()):
+                if self.roi_list.item(i).text() == name:
+                    self.roi_list.takeItem(i)
+                    break
+            self.cell_markers.rename_roi(name, None)
+            self.refresh_rois()
+            self.update_results_table()
     
     def update_results_table(self):
-        """Update results table."""
-        markers_in_roi = [m for m in self.cell_markers if m.roi_name]
-        
-        results = {}
-        for marker in markers_in_roi:
-            key = (marker.cell_type, marker.roi_name)
-            results[key] = results.get(key, 0) + 1
+        """Schedule a results table update; edits arriving within 30 ms share one rebuild."""
+        self._results_timer.start()
+    
+    def _fill_results_table(self):
+        """Rebuild the results table from the current marker counts."""
+        results = self.cell_markers.roi_counts()
         
         self.results_table.setRowCount(len(results))
         for i, ((cell_type, roi_name), count) in enumerate(sorted(results.items())):
@@ -1566,7 +1825,6 @@ class FluoroAnalyzer(QMainWindow):
     
     def export_csv(self):
         """Export results to CSV."""
-        markers_in_roi = [m for m in self.cell_markers if m.roi_name]
         closed_rois = [roi for roi in self.rois if roi.closed]
         
         if not closed_rois:
@@ -1579,30 +1837,8 @@ class FluoroAnalyzer(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    image_name = Path(self.current_file).name if self.current_file else "Unknown"
-                    
-                    # Write marker details section
-                    writer.writerow(["=== Marker Details ==="])
-                    writer.writerow(["Image", "Cell Type", "Marker #", "X", "Y", "ROI"])
-                    for marker in markers_in_roi:
-                        writer.writerow([
-                            image_name, marker.cell_type, marker.marker_number,
-                            f"{marker.position.x():.2f}", f"{marker.position.y():.2f}",
-                            marker.roi_name
-                        ])
-                    
-                    # Write summary section with all combinations (including zeros)
-                    writer.writerow([])  # Empty row separator
-                    writer.writerow(["=== Summary (per ROI) ==="])
-                    writer.writerow(["Image", "ROI", "Cell Type", "Count"])
-                    
-                    for roi in closed_rois:
-                        for cell_type_name in self.cell_types.keys():
-                            count = sum(1 for m in markers_in_roi 
-                                       if m.roi_name == roi.name and m.cell_type == cell_type_name)
-                            writer.writerow([image_name, roi.name, cell_type_name, count])
+                image_name = self.current_path.name if self.current_file else "Unknown"
+                self._write_results_csv(file_path, image_name, closed_rois, self.cell_markers.roi_counts())
                 
                 self.status_bar.showMessage(f"Exported to {file_path}")
                 return file_path
@@ -1610,16 +1846,44 @@ class FluoroAnalyzer(QMainWindow):
                 QMessageBox.critical(self, "Error", f"Failed to export: {e}")
         return None
     
+    def _write_results_csv(self, path: str, image_name: str, closed_rois: list, counts: dict):
+        """Write the marker details and per-ROI summary CSV; counts is MarkerStore.roi_counts()."""
+        store = self.cell_markers
+        type_names = store.type_names
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            
+            # Write marker details section, formatted straight from the store's
+            # arrays rather than through per-marker CellMarker snapshots
+            writer.writerow(["=== Marker Details ==="])
+            writer.writerow(["Image", "Cell Type", "Marker #", "X", "Y", "ROI"])
+            markers = zip(store.positions.tolist(), store.type_idx.tolist(), store.number.tolist(), store.roi_names)
+            for (x, y), type_idx, marker_number, roi_name in markers:
+                if roi_name:
+                    writer.writerow([image_name, type_names[type_idx], marker_number, f"{x:.2f}", f"{y:.2f}", roi_name])
+            
+            # Write summary section with all combinations (including zeros)
+            writer.writerow([])  # Empty row separator
+            writer.writerow(["=== Summary (per ROI) ==="])
+            writer.writerow(["Image", "ROI", "Cell Type", "Count"])
+            
+            for roi in closed_rois:
+                for cell_type_name in self.cell_types.keys():
+                    count = counts.get((cell_type_name, roi.name), 0)
+                    writer.writerow([image_name, roi.name, cell_type_name, count])
+    
     def export_image(self, base_path: str) -> Optional[str]:
         """Export overlay image."""
         if self.image_data is None:
             return None
         
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
             
-            adjusted_data = apply_all_adjustments(self.image_data, self.image_adjustments)
-            img_data = adjusted_data.copy()
+            # Served from the adjustment cache when the display already computed
+            # it. No defensive copy: Pillow copies RGB pixels into its own
+            # buffer, so drawing never touches the shared result.
+            img_data = apply_all_adjustments(self.image_data, self.image_adjustments)
             
             if img_data.ndim == 2:
                 img_data = np.stack([img_data] * 3, axis=-1)
@@ -1629,41 +1893,44 @@ class FluoroAnalyzer(QMainWindow):
             img = Image.fromarray(img_data, 'RGB')
             draw = ImageDraw.Draw(img)
             
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-                small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 10)
-            except:
-                font = ImageFont.load_default()
-                small_font = font
+            small_font = _overlay_font(10)
             
             for roi in self.rois:
-                if roi.closed and len(roi.points) >= 3:
-                    color = (roi.color.red(), roi.color.green(), roi.color.blue())
+                if roi.closed and roi.num_points >= 3:
+                    color = roi.rgb
                     points = [(int(p[0]), int(p[1])) for p in roi.points]
                     
-                    for i in range(len(points)):
-                        p1 = points[i]
-                        p2 = points[(i + 1) % len(points)]
-                        draw.line([p1, p2], fill=color, width=roi.line_width)
+                    # The whole closed outline in one call; same pixels as drawing each edge
+                    draw.line(points + [points[0]], fill=color, width=roi.line_width)
                     
                     draw.text((points[0][0], points[0][1] - 15), roi.name, fill=color, font=small_font)
             
-            for marker in self.cell_markers:
-                if marker.cell_type in self.cell_types:
-                    cell_type = self.cell_types[marker.cell_type]
-                    color = (cell_type.color.red(), cell_type.color.green(), cell_type.color.blue())
-                    pos = (int(marker.position.x()), int(marker.position.y()))
-                    size = cell_type.marker_size // 2
+            # Per cell type drawing settings and label font, indexed like the
+            # marker store's type_idx so the loop below does no per-marker lookups
+            styles = []
+            for name in self.cell_markers.type_names:
+                cell_type = self.cell_types.get(name)
+                if cell_type is None:
+                    styles.append(None)
+                    continue
+                styles.append((
+                    cell_type, cell_type.rgb, cell_type.marker_size // 2, _overlay_font(cell_type.label_size)
+                ))
+            
+            markers = zip(
+                self.cell_markers.positions.tolist(),
+                self.cell_markers.type_idx.tolist(),
+                self.cell_markers.number.tolist()
+            )
+            for (x, y), type_idx, marker_number in markers:
+                style = styles[type_idx]
+                if style is not None:
+                    cell_type, color, size, marker_font = style
+                    pos = (int(x), int(y))
                     offset = cell_type.label_offset
                     
-                    # Create font with proper size
-                    try:
-                        marker_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", cell_type.label_size)
-                    except:
-                        marker_font = font
-                    
                     if cell_type.marker_type == MarkerType.DOT:
-                        dot_radius = max(2, cell_type.marker_size // 2)
+                        dot_radius = max(2, size)
                         draw.ellipse([pos[0]-dot_radius, pos[1]-dot_radius, pos[0]+dot_radius, pos[1]+dot_radius], fill=color)
                     elif cell_type.marker_type == MarkerType.CIRCLE:
                         draw.ellipse([pos[0]-size, pos[1]-size, pos[0]+size, pos[1]+size], outline=color, width=2)
@@ -1671,7 +1938,7 @@ class FluoroAnalyzer(QMainWindow):
                         draw.rectangle([pos[0]-size, pos[1]-size, pos[0]+size, pos[1]+size], outline=color, width=2)
                     
                     # Position label based on label_position setting
-                    label_text = str(marker.marker_number)
+                    label_text = str(marker_number)
                     label_pos = cell_type.label_position
                     
                     if label_pos == LabelPosition.RIGHT:
@@ -1688,18 +1955,24 @@ class FluoroAnalyzer(QMainWindow):
                     draw.text(text_pos, label_text, fill=color, font=marker_font)
             
             output_path = f"{base_path}_overlay.png"
-            img.save(output_path, 'PNG', optimize=True)
+            # zlib's default level: optimize (level 9 plus an extra pass) took
+            # ~10x longer on a full-size overlay for an ~8% smaller file
+            img.save(output_path, 'PNG', compress_level=6)
             return output_path
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export image: {e}")
             return None
     
-    def export_json(self, base_path: str) -> Optional[str]:
-        """Export coordinates to JSON."""
+    def export_json(self, base_path: str, counts: Optional[dict] = None) -> Optional[str]:
+        """Export coordinates to JSON.
+        
+        counts (MarkerStore.roi_counts()) may be passed in when the caller has
+        already computed it; it is computed otherwise.
+        """
         try:
             data = {
-                "image": Path(self.current_file).name if self.current_file else "Unknown",
+                "image": self.current_path.name if self.current_file else "Unknown",
                 "image_size": {
                     "width": self.image_data.shape[1] if self.image_data is not None else 0,
                     "height": self.image_data.shape[0] if self.image_data is not None else 0
@@ -1741,17 +2014,19 @@ class FluoroAnalyzer(QMainWindow):
                 }
                 data["markers"].append(marker_data)
             
+            if counts is None:
+                counts = self.cell_markers.roi_counts()
             for cell_type in self.cell_types:
                 data["summary"][cell_type] = {}
                 for roi in self.rois:
                     if roi.closed:
-                        count = sum(1 for m in markers_in_roi 
-                                   if m.cell_type == cell_type and m.roi_name == roi.name)
-                        data["summary"][cell_type][roi.name] = count
+                        data["summary"][cell_type][roi.name] = counts.get((cell_type, roi.name), 0)
             
             output_path = f"{base_path}_coordinates.json"
+            # Encoding to one string and writing it once is much faster than
+            # json.dump, which writes every indented fragment separately
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
             
             return output_path
             
@@ -1761,7 +2036,6 @@ class FluoroAnalyzer(QMainWindow):
     
     def export_all(self):
         """Export all selected formats."""
-        markers_in_roi = [m for m in self.cell_markers if m.roi_name]
         closed_rois = [roi for roi in self.rois if roi.closed]
         
         if not closed_rois:
@@ -1774,9 +2048,9 @@ class FluoroAnalyzer(QMainWindow):
         
         output_dir = self.output_dir_edit.text().strip()
         if not output_dir:
-            output_dir = str(Path(self.current_file).parent)
+            output_dir = str(self.current_path.parent)
         
-        base_name = Path(self.current_file).stem
+        base_name = self.current_path.stem
         base_path = str(Path(output_dir) / base_name)
         
         # Count total steps for progress
@@ -1792,6 +2066,11 @@ class FluoroAnalyzer(QMainWindow):
             QMessageBox.warning(self, "No Export", "No export options selected.")
             return
         
+        # Counted once, only when needed, and shared by the CSV and JSON exports
+        counts = None
+        if self.export_csv_checkbox.isChecked() or self.export_json_checkbox.isChecked():
+            counts = self.cell_markers.roi_counts()
+        
         # Create progress dialog
         progress = QProgressDialog("Exporting...", "Cancel", 0, total_steps, self)
         progress.setWindowTitle("Exporting Data")
@@ -1815,31 +2094,7 @@ class FluoroAnalyzer(QMainWindow):
                     
                     csv_path = f"{base_path}_results.csv"
                     try:
-                        with open(csv_path, 'w', newline='') as f:
-                            writer = csv.writer(f)
-                            image_name = Path(self.current_file).name
-                            
-                            # Write marker details section
-                            writer.writerow(["=== Marker Details ==="])
-                            writer.writerow(["Image", "Cell Type", "Marker #", "X", "Y", "ROI"])
-                            for marker in markers_in_roi:
-                                writer.writerow([
-                                    image_name, marker.cell_type, marker.marker_number,
-                                    f"{marker.position.x():.2f}", f"{marker.position.y():.2f}",
-                                    marker.roi_name
-                                ])
-                            
-                            # Write summary section with all combinations (including zeros)
-                            writer.writerow([])  # Empty row separator
-                            writer.writerow(["=== Summary (per ROI) ==="])
-                            writer.writerow(["Image", "ROI", "Cell Type", "Count"])
-                            
-                            for roi in closed_rois:
-                                for cell_type_name in self.cell_types.keys():
-                                    count = sum(1 for m in markers_in_roi 
-                                               if m.roi_name == roi.name and m.cell_type == cell_type_name)
-                                    writer.writerow([image_name, roi.name, cell_type_name, count])
-                            
+                        self._write_results_csv(csv_path, self.current_path.name, closed_rois, counts)
                         exported_files.append(csv_path)
                     except Exception as e:
                         QMessageBox.warning(self, "Warning", f"Failed to export CSV: {e}")
@@ -1854,7 +2109,7 @@ class FluoroAnalyzer(QMainWindow):
                     progress.setLabelText("Exporting JSON...")
                     QApplication.processEvents()
                     
-                    json_path = self.export_json(base_path)
+                    json_path = self.export_json(base_path, counts)
                     if json_path:
                         exported_files.append(json_path)
                     
@@ -1993,7 +2248,7 @@ class FluoroAnalyzer(QMainWindow):
             self.status_bar.showMessage("Not in batch mode")
             return
         
-        self.status_bar.showMessage(f"Skipped: {Path(self.current_file).name}")
+        self.status_bar.showMessage(f"Skipped: {self.current_path.name}")
         self.load_next_batch_image()
     
     def complete_batch_processing(self):
@@ -2015,7 +2270,7 @@ class FluoroAnalyzer(QMainWindow):
         """Open file dialog to import coordinates."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import Coordinates",
-            str(Path(self.current_file).parent) if self.current_file else "",
+            str(self.current_path.parent) if self.current_file else "",
             "JSON Files (*.json);;All Files (*)"
         )
         if file_path:
@@ -2031,10 +2286,12 @@ class FluoroAnalyzer(QMainWindow):
             self.cell_markers.clear()
             self.undo_stack.clear()
             self.rois.clear()
+            self._roi_geometry = None
             self.current_roi = None
             self.roi_list.clear()
-            self.marker_items.clear()
-            self.roi_items.clear()
+            # Take the old items out of the scene now that the stores are empty
+            self.refresh_markers()
+            self.refresh_rois()
             self.selected_marker_index = -1
             
             # Import ROIs
@@ -2043,44 +2300,42 @@ class FluoroAnalyzer(QMainWindow):
                     color = QColor(roi_data.get('color', '#ffff00'))
                     roi = ROI(
                         name=roi_data.get('name', 'ROI'),
-                        color=color,
+                        color_argb=color.rgba(),
                         line_width=roi_data.get('line_width', 2),
                         closed=True
                     )
                     for point in roi_data.get('points', []):
-                        roi.points.append((point['x'], point['y']))
-                    if roi.points:
+                        roi.append_point(point['x'], point['y'])
+                    if roi.num_points:
                         self.rois.append(roi)
+                        self._roi_geometry = None
                         self.roi_list.addItem(roi.name)
             
             # Import markers
             if 'markers' in data:
-                # Group markers by cell type to assign numbers
-                type_counts = {}
-                for marker_data in data['markers']:
-                    cell_type_name = marker_data.get('cell_type', 'Type 1')
-                    
-                    # Create cell type if it doesn't exist
+                markers = data['markers']
+                cell_type_names = [marker_data.get('cell_type', 'Type 1') for marker_data in markers]
+                
+                # Create cell types that don't exist yet, in the order they first appear
+                for cell_type_name in dict.fromkeys(cell_type_names):
                     if cell_type_name not in self.cell_types:
                         # Try to find a color from an existing type, or use default
                         color = QColor(255, 255, 255)
-                        ct = CellType(cell_type_name, color, MarkerType.CIRCLE, 20)
+                        ct = CellType.from_qcolor(cell_type_name, color, MarkerType.CIRCLE, 20)
                         self.cell_types[cell_type_name] = ct
                         self.add_cell_type_widget(ct)
                         self.active_cell_combo.addItem(cell_type_name)
-                    
-                    # Track counts per type
-                    if cell_type_name not in type_counts:
-                        type_counts[cell_type_name] = 0
-                    type_counts[cell_type_name] += 1
-                    
-                    marker = CellMarker(
-                        position=QPointF(marker_data['x'], marker_data['y']),
-                        cell_type=cell_type_name,
-                        marker_number=type_counts[cell_type_name],
-                        roi_name=marker_data.get('roi')
-                    )
-                    self.cell_markers.append(marker)
+                
+                positions = np.array(
+                    [(marker_data['x'], marker_data['y']) for marker_data in markers], dtype=np.float64
+                ).reshape(-1, 2)
+                self.cell_markers.extend(
+                    positions, cell_type_names, 0,
+                    [marker_data.get('roi') for marker_data in markers]
+                )
+                # Number each type 1..n in file order (the store was cleared above)
+                for cell_type_name in dict.fromkeys(cell_type_names):
+                    self.cell_markers.renumber_type(cell_type_name)
             
             # Import adjustments if available
             if 'adjustments' in data:
@@ -2122,6 +2377,12 @@ class FluoroAnalyzer(QMainWindow):
         QTimer.singleShot(timeout_ms, msg_box.accept)
         msg_box.exec()
     
+    def closeEvent(self, event):
+        """Stop the adjustment thread before closing."""
+        self._adjust_thread.quit()
+        self._adjust_thread.wait()
+        super().closeEvent(event)
+    
     def dragEnterEvent(self, event):
         """Handle drag enter."""
         if event.mimeData().hasUrls():
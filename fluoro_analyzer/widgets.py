@@ -6,11 +6,24 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QComboBox,
     QSpinBox, QColorDialog, QLineEdit, QMessageBox
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 
 from .datatypes import CellType, MarkerType, LabelPosition
 
+# Label position combo entries, in LabelPosition order
+_LABEL_POS_ABBREV = {
+    LabelPosition.RIGHT: "R",
+    LabelPosition.LEFT: "L",
+    LabelPosition.TOP: "T",
+    LabelPosition.BOTTOM: "B",
+    LabelPosition.TOP_RIGHT: "TR",
+    LabelPosition.TOP_LEFT: "TL",
+    LabelPosition.BOTTOM_RIGHT: "BR",
+    LabelPosition.BOTTOM_LEFT: "BL",
+}
+_LABEL_POS_INDEX = {lp: i for i, lp in enumerate(_LABEL_POS_ABBREV)}
+
 
 class CellTypeWidget(QWidget):
     """Widget for configuring a cell type."""
@@ -22,6 +35,14 @@ class CellTypeWidget(QWidget):
     def __init__(self, cell_type: CellType, parent=None):
         super().__init__(parent)
         self.cell_type = cell_type
+        
+        # Coalesce bursts of edits (e.g. scrolling a spinbox) into one type_changed,
+        # since each emission rebuilds every marker on the canvas
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self.type_changed.emit)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -103,21 +124,9 @@ class CellTypeWidget(QWidget):
         self.label_pos_combo = QComboBox()
         self.label_pos_combo.setMinimumWidth(50)
         self.label_pos_combo.setToolTip("Label position")
-        pos_abbrev = {
-            LabelPosition.RIGHT: "R",
-            LabelPosition.LEFT: "L",
-            LabelPosition.TOP: "T",
-            LabelPosition.BOTTOM: "B",
-            LabelPosition.TOP_RIGHT: "TR",
-            LabelPosition.TOP_LEFT: "TL",
-            LabelPosition.BOTTOM_RIGHT: "BR",
-            LabelPosition.BOTTOM_LEFT: "BL",
-        }
-        for lp in LabelPosition:
-            self.label_pos_combo.addItem(pos_abbrev[lp], lp)
-        self.label_pos_combo.setCurrentIndex(
-            list(LabelPosition).index(self.cell_type.label_position)
-        )
+        for lp, abbrev in _LABEL_POS_ABBREV.items():
+            self.label_pos_combo.addItem(abbrev, lp)
+        self.label_pos_combo.setCurrentIndex(_LABEL_POS_INDEX[self.cell_type.label_position])
         self.label_pos_combo.currentIndexChanged.connect(self.label_pos_changed)
         row2.addWidget(self.label_pos_combo)
         
@@ -177,27 +186,27 @@ class CellTypeWidget(QWidget):
             self.color_btn.setStyleSheet(
                 f"background-color: {color.name()}; border: 1px solid #555; border-radius: 3px;"
             )
-            self.type_changed.emit()
+            self._emit_timer.start()
     
     def marker_type_changed(self, index):
         self.cell_type.marker_type = self.marker_combo.currentData()
-        self.type_changed.emit()
+        self._emit_timer.start()
     
     def size_changed(self, value):
         self.cell_type.marker_size = value
-        self.type_changed.emit()
+        self._emit_timer.start()
     
     def label_pos_changed(self, index):
         self.cell_type.label_position = self.label_pos_combo.currentData()
-        self.type_changed.emit()
+        self._emit_timer.start()
     
     def label_size_changed(self, value):
         self.cell_type.label_size = value
-        self.type_changed.emit()
+        self._emit_timer.start()
     
     def label_offset_changed(self, value):
         self.cell_type.label_offset = value
-        self.type_changed.emit()
+        self._emit_timer.start()
     
     def update_count(self, count: int):
         self.cell_type.count = count
@@ -13,6 +13,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPixmapCache
 from fluoro_analyzer import FluoroAnalyzer
 
 
@@ -21,6 +22,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("FluoroCount")
     app.setApplicationVersion("1.0.0")
+    QPixmapCache.setCacheLimit(256 * 1024)  # KB; room for a few full-size frames of large images
     
     window = FluoroAnalyzer()
     window.show()
@@ -0,0 +1,51 @@
+"""Tests for region (roi) updates in the image adjustment pipeline."""
+
+import unittest
+
+import numpy as np
+
+from fluoro_analyzer import ImageAdjustments
+from fluoro_analyzer import image_processing
+
+
+class RegionUpdateTest(unittest.TestCase):
+    
+    def setUp(self):
+        image_processing.clear_adjustment_cache()
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (60, 80, 3), dtype=np.uint8)
+        self.base = ImageAdjustments()
+        self.base.brightness_r = 10
+        self.dragged = self.base.copy()
+        self.dragged.brightness_r = 40
+        self.dragged.noise_g = 5
+    
+    def tearDown(self):
+        image_processing.clear_adjustment_cache()
+    
+    def test_region_matches_full_result_and_keeps_the_rest(self):
+        base_result = image_processing.apply_all_adjustments(self.image, self.base)
+        base_copy = base_result.copy()
+        
+        region = image_processing.apply_all_adjustments(self.image, self.dragged, roi=(10, 5, 50, 40))
+        
+        full = image_processing.apply_all_adjustments(self.image.copy(), self.dragged)
+        np.testing.assert_array_equal(region[5:40, 10:50], full[5:40, 10:50])
+        np.testing.assert_array_equal(region[40:], base_copy[40:])
+        np.testing.assert_array_equal(region[:, 50:], base_copy[:, 50:])
+        # The cached full result the region was composed onto is left untouched
+        np.testing.assert_array_equal(base_result, base_copy)
+    
+    def test_consecutive_regions_reuse_the_working_buffer(self):
+        image_processing.apply_all_adjustments(self.image, self.base)
+        first = image_processing.apply_all_adjustments(self.image, self.dragged, roi=(0, 0, 20, 20))
+        self.dragged.brightness_r = 60
+        second = image_processing.apply_all_adjustments(self.image, self.dragged, roi=(20, 20, 40, 40))
+        
+        self.assertIs(first, second)
+        full = image_processing.apply_all_adjustments(self.image.copy(), self.dragged)
+        np.testing.assert_array_equal(second[20:40, 20:40], full[20:40, 20:40])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for importing marker/ROI coordinates into the main window."""
+
+import json
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PIL import Image
+from PyQt6.QtWidgets import QApplication
+
+from fluoro_analyzer import FluoroAnalyzer
+
+
+class ImportCoordinatesTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        image_path = os.path.join(self.tmp.name, "image.png")
+        Image.fromarray(np.zeros((100, 120, 3), dtype=np.uint8)).save(image_path)
+        self.coords_path = os.path.join(self.tmp.name, "markers.json")
+        with open(self.coords_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'rois': [{
+                    'name': 'ROI_A',
+                    'points': [{'x': 10, 'y': 10}, {'x': 60, 'y': 10}, {'x': 60, 'y': 60}]
+                }],
+                'markers': [
+                    {'x': 20, 'y': 20, 'cell_type': 'Type 1'},
+                    {'x': 30, 'y': 40, 'cell_type': 'Type 1'},
+                ]
+            }, f)
+        self.window = FluoroAnalyzer()
+        self.window.load_image(image_path)
+    
+    def tearDown(self):
+        self.window.close()
+        self.tmp.cleanup()
+    
+    def test_reimport_replaces_scene_items(self):
+        self.window.import_coordinates(self.coords_path)
+        item_count = len(self.window.canvas.scene.items())
+        
+        self.window.import_coordinates(self.coords_path)
+        
+        self.assertEqual(len(self.window.cell_markers), 2)
+        self.assertEqual(len(self.window.rois), 1)
+        self.assertEqual(len(self.window.canvas.scene.items()), item_count)
+
+
+if __name__ == '__main__':
+    unittest.main()